@@ -23,6 +23,9 @@ class DataFormatter:
         'perf': '性能优化'
     }
 
+    # Conventional Commits 格式: type(scope): description 或 type: description
+    CONVENTIONAL_PATTERN = re.compile(r'^(\w+)(\(.+?\))?:\s*(.+)')
+
     # 需要过滤的噪声提交关键词
     NOISE_KEYWORDS = [
         'merge', 'sync', 'update readme', 'update version',
@@ -43,17 +46,55 @@ class DataFormatter:
         Returns:
             提交类型(feat/fix/other)
         """
-        message_lower = message.lower().strip()
-
         # 检查是否符合 Conventional Commits 格式
-        # 格式: type(scope): description 或 type: description
-        match = re.match(r'^(\w+)(\(.+?\))?:\s*(.+)', message)
+        match = self.CONVENTIONAL_PATTERN.match(message)
         if match:
             commit_type = match.group(1).lower()
             if commit_type in self.COMMIT_TYPES:
                 return commit_type
 
-        # 简单的关键词匹配
+        return self._classify_by_keywords(message.lower().strip())
+
+    def classify_many(self, messages: List[str]) -> List[str]:
+        """
+        批量分类提交类型,结果与逐条调用 classify_commit 一致
+
+        Args:
+            messages: 提交消息列表
+
+        Returns:
+            与 messages 一一对应的提交类型列表
+        """
+        match = self.CONVENTIONAL_PATTERN.match
+        commit_types = self.COMMIT_TYPES
+        by_keywords = self._classify_by_keywords
+
+        # 相同消息(如 merge/wip 类提交)只分类一次
+        seen = {}
+        result = []
+        append = result.append
+        for message in messages:
+            commit_type = seen.get(message)
+            if commit_type is None:
+                m = match(message)
+                if m and m.group(1).lower() in commit_types:
+                    commit_type = m.group(1).lower()
+                else:
+                    commit_type = by_keywords(message.lower().strip())
+                seen[message] = commit_type
+            append(commit_type)
+        return result
+
+    def _classify_by_keywords(self, message_lower: str) -> str:
+        """
+        按关键词分类提交类型
+
+        Args:
+            message_lower: 已转为小写并去除首尾空白的提交消息
+
+        Returns:
+            提交类型
+        """
         if any(keyword in message_lower for keyword in ['feat', 'feature', '新增', '添加']):
             return 'feat'
         elif any(keyword in message_lower for keyword in ['fix', 'bug', '修复', '修正']):
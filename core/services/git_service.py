@@ -62,7 +62,8 @@ class GitService:
         author_name: Optional[str] = None,
         author_email: Optional[str] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None
     ) -> List[CommitRecord]:
         """
         获取提交记录
@@ -72,6 +73,7 @@ class GitService:
             author_email: 作者邮箱(可选)
             start_date: 开始日期(可选)
             end_date: 结束日期(可选)
+            limit: 最多返回的提交数(可选)
 
         Returns:
             提交记录列表
@@ -100,6 +102,10 @@ class GitService:
             elif end_date:
                 kwargs['before'] = end_date.strftime('%Y-%m-%d')
 
+            # 没有作者过滤时直接让 git log -n 限制输出条数
+            if limit is not None and not author_name and not author_email:
+                kwargs['max_count'] = limit
+
             # 获取所有提交
             for commit in repo.iter_commits(**kwargs):
                 # 过滤作者
@@ -120,6 +126,10 @@ class GitService:
                 )
                 commits.append(record)
 
+                # 达到数量上限后停止读取 git log 输出
+                if limit is not None and len(commits) >= limit:
+                    break
+
             return commits
 
         except GitCommandError as e:
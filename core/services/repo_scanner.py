@@ -17,6 +17,9 @@ class RepoInfo:
     author_email: str   # 从 git config 读取的作者邮箱
     depth: int          # 相对于扫描根目录的深度
     parent_path: str    # 父目录路径
+    display_author: str = ""    # 用于显示的作者信息 "name <email>"
+    normalized_path: str = ""   # 规范化后的路径(用于与已添加仓库比较)
+    is_added: bool = False      # 是否已添加到配置中
 
 
 class RepoScanner:
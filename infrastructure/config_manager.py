@@ -277,6 +277,43 @@ class ConfigManager:
         self.config['repos'].append(new_repo)
         return repo_id
 
+    def add_repos_bulk(self, repos: List[Dict[str, Any]]) -> List[str]:
+        """
+        批量添加仓库(已存在相同路径的仓库会被跳过)
+
+        Args:
+            repos: 仓库配置列表,每项包含 name, path, author_name, author_email, enabled
+
+        Returns:
+            新增仓库的 ID 列表
+        """
+        if 'repos' not in self.config:
+            self.config['repos'] = []
+
+        def normalize(path: str) -> str:
+            return os.path.normcase(os.path.normpath(path))
+
+        existing_paths = {normalize(r.get('path', '')) for r in self.config['repos']}
+
+        new_repos = []
+        for repo in repos:
+            path = repo.get('path', '')
+            key = normalize(path)
+            if not path or key in existing_paths:
+                continue
+            existing_paths.add(key)
+            new_repos.append({
+                'id': str(uuid.uuid4()),
+                'name': repo.get('name', ''),
+                'path': path,
+                'author_name': repo.get('author_name', ''),
+                'author_email': repo.get('author_email', ''),
+                'enabled': repo.get('enabled', True)
+            })
+
+        self.config['repos'].extend(new_repos)
+        return [r['id'] for r in new_repos]
+
     def update_repo(self, repo_id: str, **kwargs) -> bool:
         """
         更新仓库配置
@@ -27,7 +27,7 @@ class AppLogger:
             return
 
         # 创建日志目录（支持打包环境）
-        log_dir = get_data_path("logs")
+        log_dir = get_data_path("logs", is_dir=True)
 
         # 创建logger
         self._logger = logging.getLogger("git-report")
@@ -3,13 +3,10 @@ Git 提交记录智能报告生成器
 主入口文件
 """
 import sys
-import os
 from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QIcon
 from ui.main_window import MainWindow
 from ui.themes.theme_manager import ThemeManager
 from infrastructure.logger import get_logger
-from utils.resource_path import get_resource_path
 
 # 初始化日志
 logger = get_logger()
@@ -25,9 +22,9 @@ def main():
     app.setApplicationName("Git 提交记录智能报告生成器")
 
     # 设置应用图标（支持打包环境）
-    icon_path = get_resource_path('app_icon.ico')
-    if os.path.exists(icon_path):
-        app.setWindowIcon(QIcon(icon_path))
+    app_icon = MainWindow.app_icon()
+    if not app_icon.isNull():
+        app.setWindowIcon(app_icon)
 
     # 加载配置
     config = ConfigManager()
@@ -0,0 +1,48 @@
+"""
+DataFormatter 测试
+"""
+import pytest
+
+pytest.importorskip("git")
+
+from core.services.formatter import DataFormatter  # noqa: E402
+
+
+@pytest.fixture
+def formatter():
+    """数据格式化器"""
+    return DataFormatter()
+
+
+def test_classify_many_matches_classify_commit(formatter):
+    """批量分类结果应与逐条调用 classify_commit 一致"""
+    messages = [
+        # Conventional Commits 前缀
+        "feat: 新增导出功能",
+        "fix(ui): 修复按钮状态",
+        "Docs: update README",
+        "perf(core): 缓存分类结果",
+        # 前缀不是已知类型,回退到关键词分类
+        "wip: add feature flag",
+        # 关键词分类
+        "修复登录问题",
+        "Refactor the scanner",
+        "添加测试用例",
+        "improve performance of log view",
+        "bump version",
+        # 重复消息
+        "Merge branch 'main' into dev",
+        "fix: 修复按钮状态",
+        "Merge branch 'main' into dev",
+        "fix: 修复按钮状态",
+        # 空消息和空白消息
+        "",
+        "   ",
+    ]
+
+    assert formatter.classify_many(messages) == [formatter.classify_commit(m) for m in messages]
+
+
+def test_classify_many_empty_list(formatter):
+    """空列表返回空列表"""
+    assert formatter.classify_many([]) == []
@@ -0,0 +1,47 @@
+"""
+GitService 测试
+"""
+import pytest
+
+git = pytest.importorskip("git")
+
+from core.services.git_service import GitService  # noqa: E402
+
+
+ALICE = git.Actor("alice", "alice@example.com")
+BOB = git.Actor("bob", "bob@example.com")
+
+
+@pytest.fixture
+def repo_path(tmp_path):
+    """交替由 alice 和 bob 提交的临时仓库(最新的提交在前: bob, alice, bob, ...)"""
+    repo = git.Repo.init(tmp_path)
+    file_path = tmp_path / "file.txt"
+    for i in range(6):
+        file_path.write_text(str(i))
+        repo.index.add(["file.txt"])
+        author = ALICE if i % 2 == 0 else BOB
+        repo.index.commit(f"commit {i}", author=author, committer=author)
+    return str(tmp_path)
+
+
+def test_get_commits_without_limit(repo_path):
+    """不限制数量时返回全部提交"""
+    commits = GitService(repo_path).get_commits()
+    assert [c.message for c in commits] == [f"commit {i}" for i in range(5, -1, -1)]
+
+
+def test_get_commits_limit_without_author(repo_path):
+    """没有作者过滤时返回最新的 limit 条提交"""
+    commits = GitService(repo_path).get_commits(limit=2)
+    assert [c.message for c in commits] == ["commit 5", "commit 4"]
+
+
+def test_get_commits_limit_with_author(repo_path):
+    """有作者过滤时 limit 作用于过滤后的提交"""
+    commits = GitService(repo_path).get_commits(author_name="alice", limit=2)
+    assert [c.message for c in commits] == ["commit 4", "commit 2"]
+    assert all(c.author == "alice" for c in commits)
+
+    commits = GitService(repo_path).get_commits(author_email="bob@example.com", limit=5)
+    assert [c.message for c in commits] == ["commit 5", "commit 3", "commit 1"]
@@ -0,0 +1,73 @@
+"""
+ConfigManager 测试
+"""
+import ntpath
+import types
+
+import pytest
+
+import infrastructure.config_manager as config_manager_module
+from infrastructure.config_manager import ConfigManager
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    """不含仓库的配置管理器"""
+    config = ConfigManager(str(tmp_path / "config.json"))
+    config.config['repos'] = []
+    return config
+
+
+def test_add_repos_bulk_returns_new_ids(config_manager):
+    """返回新增仓库的 ID,并按顺序追加到配置中"""
+    ids = config_manager.add_repos_bulk([
+        {'name': 'repo-a', 'path': '/work/repo-a'},
+        {'name': 'repo-b', 'path': '/work/repo-b', 'enabled': False},
+    ])
+
+    repos = config_manager.get_repos()
+    assert len(ids) == 2
+    assert [r['id'] for r in repos] == ids
+    assert [r['name'] for r in repos] == ['repo-a', 'repo-b']
+    assert [r['enabled'] for r in repos] == [True, False]
+
+
+def test_add_repos_bulk_skips_existing_paths(config_manager):
+    """与已有仓库路径相同(包括末尾斜杠不同)的仓库会被跳过"""
+    config_manager.add_repo(name='repo-a', path='/work/repo-a')
+
+    ids = config_manager.add_repos_bulk([
+        {'name': 'repo-a', 'path': '/work/repo-a/'},
+        {'name': 'repo-b', 'path': '/work/repo-b'},
+    ])
+
+    assert len(ids) == 1
+    assert [r['name'] for r in config_manager.get_repos()] == ['repo-a', 'repo-b']
+
+
+def test_add_repos_bulk_dedups_within_batch(config_manager):
+    """同一批次中的重复路径只添加一次,空路径被忽略"""
+    ids = config_manager.add_repos_bulk([
+        {'name': 'repo-a', 'path': '/work/repo-a'},
+        {'name': 'repo-a-copy', 'path': '/work/./repo-a'},
+        {'name': 'no-path', 'path': ''},
+    ])
+
+    assert len(ids) == 1
+    assert [r['name'] for r in config_manager.get_repos()] == ['repo-a']
+
+
+def test_add_repos_bulk_windows_paths(config_manager, monkeypatch):
+    """Windows 路径比较时不区分大小写和分隔符"""
+    config_manager.add_repo(name='repo-a', path='C:\\Work\\Repo-A')
+    monkeypatch.setattr(config_manager_module, 'os', types.SimpleNamespace(path=ntpath))
+
+    ids = config_manager.add_repos_bulk([
+        {'name': 'repo-a-lower', 'path': 'c:\\work\\repo-a\\'},
+        {'name': 'repo-a-slash', 'path': 'C:/Work/Repo-A'},
+        {'name': 'repo-b', 'path': 'C:\\Work\\Repo-B'},
+        {'name': 'repo-b-upper', 'path': 'C:\\WORK\\REPO-B'},
+    ])
+
+    assert len(ids) == 1
+    assert [r['name'] for r in config_manager.get_repos()] == ['repo-a', 'repo-b']
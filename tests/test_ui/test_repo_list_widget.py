@@ -0,0 +1,49 @@
+"""
+RepoListWidget 测试
+"""
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from infrastructure.config_manager import ConfigManager  # noqa: E402
+from ui.widgets.repo_list_widget import RepoListWidget  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """QApplication 实例"""
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    """包含两个已启用仓库的配置管理器"""
+    config = ConfigManager(str(tmp_path / "config.json"))
+    config.config['repos'] = []
+    config.add_repo(name="repo-a", path=str(tmp_path / "repo-a"))
+    config.add_repo(name="repo-b", path=str(tmp_path / "repo-b"))
+    return config
+
+
+def test_toggle_updates_enabled_count(qapp, config_manager):
+    """取消勾选再重新勾选后,统计应与实际启用数一致"""
+    widget = RepoListWidget(config_manager)
+    assert widget.stats_label.text() == "总计: 2 个仓库, 已启用: 2 个"
+
+    repo_id = config_manager.get_repos()[0]['id']
+    checkbox = widget._items[repo_id].enabled_checkbox
+
+    checkbox.setChecked(False)
+    assert widget.stats_label.text() == "总计: 2 个仓库, 已启用: 1 个"
+    assert config_manager.get_repos()[0]['enabled'] is False
+
+    checkbox.setChecked(True)
+    assert widget.stats_label.text() == "总计: 2 个仓库, 已启用: 2 个"
+    assert config_manager.get_repos()[0]['enabled'] is True
+
+    widget._save_timer.stop()
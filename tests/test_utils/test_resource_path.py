@@ -0,0 +1,50 @@
+"""
+resource_path 测试
+"""
+import os
+
+import pytest
+
+import utils.resource_path as resource_path
+from utils.resource_path import get_data_path
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """将数据根目录指向临时目录,并清空已确认目录的记录"""
+    base = tmp_path / "data"
+    monkeypatch.setattr(resource_path, "_BASE_DATA", str(base))
+    monkeypatch.setattr(resource_path, "_ensured_dirs", set())
+    return base
+
+
+def test_data_dir_is_created(data_dir):
+    """不带参数时返回并创建数据目录本身"""
+    assert get_data_path() == str(data_dir)
+    assert data_dir.is_dir()
+
+
+def test_file_path_does_not_create_file(data_dir):
+    """文件路径只确保数据目录存在,不创建该路径本身"""
+    path = get_data_path("config.json")
+
+    assert path == os.path.join(str(data_dir), "config.json")
+    assert data_dir.is_dir()
+    assert not os.path.exists(path)
+
+
+def test_dir_path_is_created(data_dir):
+    """is_dir=True 时创建该目录"""
+    path = get_data_path("logs", is_dir=True)
+
+    assert path == os.path.join(str(data_dir), "logs")
+    assert os.path.isdir(path)
+
+
+def test_dir_is_checked_once(data_dir):
+    """已确认存在的目录不再访问文件系统"""
+    path = get_data_path("logs", is_dir=True)
+    os.rmdir(path)
+
+    assert get_data_path("logs", is_dir=True) == path
+    assert not os.path.exists(path)
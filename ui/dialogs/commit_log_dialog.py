@@ -6,11 +6,10 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout,
     QTabWidget, QWidget, QFileDialog, QApplication
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QMimeData
 from PySide6.QtGui import QFont
 from qfluentwidgets import PushButton, PrimaryPushButton, TextBrowser, MessageBox, InfoBar, InfoBarPosition
 from typing import List
-from collections import defaultdict
 from infrastructure.logger import get_logger
 from core.services.git_service import CommitRecord
 from core.services.formatter import DataFormatter
@@ -21,6 +20,9 @@ logger = get_logger()
 class CommitLogDialog(QDialog):
     """提交日志查看对话框"""
 
+    # 按类型展示时的输出顺序
+    TYPE_ORDER = ('feat', 'fix', 'refactor', 'docs', 'perf', 'test', 'chore', 'style', 'other')
+
     def __init__(self, commits: List[CommitRecord], parent=None):
         """
         初始化对话框
@@ -32,6 +34,15 @@ class CommitLogDialog(QDialog):
         super().__init__(parent)
         self.commits = commits
         self.formatter = DataFormatter()
+        self._clipboard_mime = None  # 最近一次放入剪贴板的数据(剪贴板持有其所有权)
+        self._clipboard_key = None  # 最近一次复制的视图索引
+
+        # 预先计算每条提交在各视图中共用的字段: (commit, repo_tag, repo_label, commit_type)
+        commit_types = self.formatter.classify_many([c.message for c in self.commits])
+        self._prepared = [
+            (c, f"[{c.repo_name}] " if c.repo_name else "", c.repo_name or "未知仓库", t)
+            for c, t in zip(self.commits, commit_types)
+        ]
 
         # 生成三种不同视图的日志
         self.log_by_type = self.generate_by_type()
@@ -53,29 +64,26 @@ class CommitLogDialog(QDialog):
         lines = ["【按提交类型分类】\n"]
 
         # 按类型分组
-        grouped = defaultdict(list)
-        for commit in self.commits:
-            commit_type = self.formatter.classify_commit(commit.message)
-            grouped[commit_type].append(commit)
+        grouped = {}
+        for commit, repo_tag, _, commit_type in self._prepared:
+            grouped.setdefault(commit_type, []).append((commit, repo_tag))
 
         # 统计信息
         lines.append(f"总提交数: {len(self.commits)} 条\n")
 
         # 按预定义顺序输出各类型
-        type_order = ['feat', 'fix', 'refactor', 'docs', 'perf', 'test', 'chore', 'style', 'other']
-        for commit_type in type_order:
-            if commit_type not in grouped:
+        for commit_type in self.TYPE_ORDER:
+            commits_of_type = grouped.get(commit_type)
+            if not commits_of_type:
                 continue
 
             type_name = self.formatter.COMMIT_TYPES.get(commit_type, '其他')
-            commits_of_type = grouped[commit_type]
             lines.append(f"\n{'='*70}")
             lines.append(f"## {type_name} ({commit_type}) - {len(commits_of_type)} 条")
             lines.append('='*70 + '\n')
 
-            for commit in commits_of_type:
+            for commit, repo_tag in commits_of_type:
                 date_str = commit.date.strftime('%Y-%m-%d %H:%M:%S')
-                repo_tag = f"[{commit.repo_name}] " if commit.repo_name else ""
                 lines.append(f"📅 {date_str}")
                 lines.append(f"📦 {repo_tag}作者: {commit.author} <{commit.email}>")
                 lines.append(f"💬 {commit.message}")
@@ -97,10 +105,9 @@ class CommitLogDialog(QDialog):
         lines = ["【按仓库分组】\n"]
 
         # 按仓库分组
-        grouped = defaultdict(list)
-        for commit in self.commits:
-            repo_name = commit.repo_name or "未知仓库"
-            grouped[repo_name].append(commit)
+        grouped = {}
+        for commit, _, repo_label, commit_type in self._prepared:
+            grouped.setdefault(repo_label, []).append((commit, commit_type))
 
         lines.append(f"总提交数: {len(self.commits)} 条")
         lines.append(f"涉及仓库: {len(grouped)} 个\n")
@@ -113,11 +120,10 @@ class CommitLogDialog(QDialog):
             lines.append('='*70 + '\n')
 
             # 仓库内按日期降序排序
-            commits_in_repo.sort(key=lambda c: c.date, reverse=True)
+            commits_in_repo.sort(key=lambda p: p[0].date, reverse=True)
 
-            for commit in commits_in_repo:
+            for commit, commit_type in commits_in_repo:
                 date_str = commit.date.strftime('%Y-%m-%d %H:%M:%S')
-                commit_type = self.formatter.classify_commit(commit.message)
                 type_name = self.formatter.COMMIT_TYPES.get(commit_type, '其他')
 
                 lines.append(f"📅 {date_str} | 🏷️  {type_name}")
@@ -141,21 +147,21 @@ class CommitLogDialog(QDialog):
         lines = ["【按时间线排序】\n"]
 
         # 按日期降序排序
-        sorted_commits = sorted(self.commits, key=lambda c: c.date, reverse=True)
+        sorted_commits = sorted(self._prepared, key=lambda p: p[0].date, reverse=True)
 
         lines.append(f"总提交数: {len(self.commits)} 条")
 
         # 获取日期范围
         if sorted_commits:
-            latest = sorted_commits[0].date
-            earliest = sorted_commits[-1].date
+            latest = sorted_commits[0][0].date
+            earliest = sorted_commits[-1][0].date
             lines.append(f"时间范围: {earliest.strftime('%Y-%m-%d')} 至 {latest.strftime('%Y-%m-%d')}\n")
 
         # 按日期分组
-        by_date = defaultdict(list)
-        for commit in sorted_commits:
+        by_date = {}
+        for commit, repo_tag, _, commit_type in sorted_commits:
             date_key = commit.date.strftime('%Y-%m-%d')
-            by_date[date_key].append(commit)
+            by_date.setdefault(date_key, []).append((commit, repo_tag, commit_type))
 
         # 按日期输出
         for date_key in sorted(by_date.keys(), reverse=True):
@@ -164,11 +170,9 @@ class CommitLogDialog(QDialog):
             lines.append(f"## 📅 {date_key} ({self._get_weekday(date_key)}) - {len(commits_on_date)} 条提交")
             lines.append('='*70 + '\n')
 
-            for commit in commits_on_date:
+            for commit, repo_tag, commit_type in commits_on_date:
                 time_str = commit.date.strftime('%H:%M:%S')
-                commit_type = self.formatter.classify_commit(commit.message)
                 type_name = self.formatter.COMMIT_TYPES.get(commit_type, '其他')
-                repo_tag = f"[{commit.repo_name}] " if commit.repo_name else ""
 
                 lines.append(f"⏰ {time_str} | 🏷️  {type_name} | 📦 {repo_tag}{commit.author}")
                 lines.append(f"💬 {commit.message}")
@@ -274,7 +278,18 @@ class CommitLogDialog(QDialog):
             log_type = "按时间线"
 
         clipboard = QApplication.clipboard()
-        clipboard.setText(content)
+        # 剪贴板中仍是本视图上次复制的内容时,无需再次传输整段文本
+        already_copied = (
+            self._clipboard_key == current_index
+            and clipboard.ownsClipboard()
+            and clipboard.mimeData() is self._clipboard_mime
+        )
+        if not already_copied:
+            mime_data = QMimeData()
+            mime_data.setText(content)
+            clipboard.setMimeData(mime_data)
+            self._clipboard_mime = mime_data
+            self._clipboard_key = current_index
 
         logger.info(f"已复制{log_type}视图到剪贴板")
         InfoBar.success(
@@ -3,7 +3,7 @@
 显示操作进度
 """
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QVariantAnimation, QEasingCurve
 from qfluentwidgets import BodyLabel, SubtitleLabel, PushButton, ProgressBar
 
 
@@ -19,7 +19,6 @@ class ProgressDialog(QDialog):
         """
         super().__init__(parent)
         self.cancelled = False
-        self.auto_close_timer = None
 
         self.init_ui()
 
@@ -74,13 +73,34 @@ class ProgressDialog(QDialog):
 
         self.setLayout(layout)
 
+        # 自动关闭定时器(只创建一次,重复使用时不会残留多个定时器)
+        self.auto_close_timer = QTimer(self)
+        self.auto_close_timer.setSingleShot(True)
+        self.auto_close_timer.timeout.connect(self.accept)
+
+        # 进度刷新定时器(约30Hz),合并高频进度更新,避免每次更新都触发重绘
+        self._latest = None
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setInterval(33)
+        self._paint_timer.timeout.connect(self._flush_progress)
+
+        # 进度条动画,在两次进度更新之间平滑过渡(不需要工作线程等待)
+        self._progress_anim = QVariantAnimation(self)
+        self._progress_anim.setDuration(200)
+        self._progress_anim.setEasingCurve(QEasingCurve.OutCubic)
+        self._progress_anim.valueChanged.connect(self.progress_bar.setValue)
+
     def start(self):
         """开始进度显示"""
         self.cancelled = False
+        self.auto_close_timer.stop()
         self.progress_bar.setValue(0)
         self.step_label.setText("准备中...")
         self.cancel_btn.setEnabled(True)
         self.cancel_btn.setText("取消")
+        self._progress_anim.stop()
+        self._latest = None
+        self._paint_timer.start()
         self.show()
 
     def update_progress(self, progress: int, step_text: str):
@@ -91,8 +111,45 @@ class ProgressDialog(QDialog):
             progress: 进度百分比(0-100)
             step_text: 当前步骤描述
         """
-        self.progress_bar.setValue(progress)
-        self.step_label.setText(step_text)
+        # 只记录最新值,由定时器统一刷新到界面
+        self._latest = (progress, step_text)
+
+    def _flush_progress(self):
+        """将最新的进度刷新到界面(仅在有变化时更新控件)"""
+        if self._latest is None:
+            return
+
+        progress, step_text = self._latest
+        self._latest = None
+
+        self._animate_to(progress)
+        if self.step_label.text() != step_text:
+            self.step_label.setText(step_text)
+
+    def _animate_to(self, progress: int):
+        """
+        以动画方式将进度条过渡到目标值
+
+        Args:
+            progress: 目标进度
+        """
+        anim = self._progress_anim
+        if anim.state() == QVariantAnimation.Running:
+            if anim.endValue() == progress:
+                return
+            anim.stop()
+        current = self.progress_bar.value()
+        if current == progress:
+            return
+        anim.setStartValue(current)
+        anim.setEndValue(progress)
+        anim.start()
+
+    def _stop_progress_refresh(self):
+        """停止进度刷新并丢弃尚未刷新的进度"""
+        self._paint_timer.stop()
+        self._progress_anim.stop()
+        self._latest = None
 
     def set_success(self, message: str = "操作成功!"):
         """
@@ -101,15 +158,13 @@ class ProgressDialog(QDialog):
         Args:
             message: 成功消息
         """
+        self._stop_progress_refresh()
         self.progress_bar.setValue(100)
         self.step_label.setText(message)
         self.cancel_btn.setEnabled(False)
         self.cancel_btn.setText("完成")
 
         # 2秒后自动关闭
-        self.auto_close_timer = QTimer(self)
-        self.auto_close_timer.timeout.connect(self.accept)
-        self.auto_close_timer.setSingleShot(True)
         self.auto_close_timer.start(2000)  # 2秒
 
     def set_error(self, error_message: str):
@@ -119,14 +174,22 @@ class ProgressDialog(QDialog):
         Args:
             error_message: 错误消息
         """
+        self.auto_close_timer.stop()
+        self._stop_progress_refresh()
         self.step_label.setText(f"错误: {error_message}")
         self.cancel_btn.setEnabled(True)
         self.cancel_btn.setText("关闭")
 
+    def dismiss(self):
+        """强制关闭对话框(操作已由调用方结束,不走取消流程)"""
+        self.cancel_btn.setEnabled(False)
+        self.reject()
+
     def on_cancel(self):
         """取消按钮点击"""
         if self.cancel_btn.text() == "取消":
             self.cancelled = True
+            self._stop_progress_refresh()
             self.step_label.setText("正在取消...")
             self.cancel_btn.setEnabled(False)
         else:
@@ -142,6 +205,17 @@ class ProgressDialog(QDialog):
         """
         return self.cancelled
 
+    def done(self, result: int):
+        """
+        关闭对话框(accept/reject 最终都会调用这里),同时停止所有定时器
+
+        Args:
+            result: 对话框结果
+        """
+        self.auto_close_timer.stop()
+        self._stop_progress_refresh()
+        super().done(result)
+
     def closeEvent(self, event):
         """关闭事件(禁止直接关闭)"""
         if self.cancel_btn.isEnabled() and self.cancel_btn.text() == "取消":
@@ -150,6 +224,6 @@ class ProgressDialog(QDialog):
             event.ignore()
         else:
             # 已完成或出错,允许关闭
-            if self.auto_close_timer:
-                self.auto_close_timer.stop()
+            self.auto_close_timer.stop()
+            self._stop_progress_refresh()
             event.accept()
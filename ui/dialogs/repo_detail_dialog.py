@@ -7,10 +7,78 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QTextEdit, QGroupBox, QFormLayout
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal, Slot
 from core.services.git_service import GitService
 
 
+class _FetchSignals(QObject):
+    """最近提交加载任务的信号"""
+    finished = Signal(str)  # 格式化后的提交文本
+
+
+class _FetchTask(QRunnable):
+    """后台加载最近提交记录的任务"""
+
+    def __init__(self, repo_config: dict):
+        super().__init__()
+        self.repo_config = dict(repo_config)
+        self.signals = _FetchSignals()
+
+    def run(self):
+        """执行加载"""
+        self.signals.finished.emit(self._load_text())
+
+    def _load_text(self) -> str:
+        """
+        读取最近7天的提交并格式化
+
+        Returns:
+            用于显示的提交文本
+        """
+        try:
+            # 创建 GitService
+            git_service = GitService(self.repo_config.get('path', ''))
+
+            # 获取最近7天的提交
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=7)
+
+            author_name = self.repo_config.get('author_name')
+            author_email = self.repo_config.get('author_email')
+
+            commits = git_service.get_commits(
+                author_name=author_name if author_name else None,
+                author_email=author_email if author_email else None,
+                start_date=start_date,
+                end_date=end_date,
+                limit=5  # 最多显示5条
+            )
+
+            if not commits:
+                return "最近7天没有提交记录"
+
+            # 格式化显示
+            lines = []
+            lines.append(f"显示最新 {len(commits)} 条提交:\n")
+
+            for commit in commits:
+                date_str = commit.date.strftime('%Y-%m-%d %H:%M')
+                message = commit.message.partition('\n')[0]  # 只显示第一行
+                if len(message) > 60:
+                    message = message[:60] + '...'
+
+                lines.append(f"[{date_str}]")
+                lines.append(f"  {commit.author} <{commit.email}>")
+                lines.append(f"  {message}")
+                lines.append(f"  Hash: {commit.hash[:8]}")
+                lines.append("")
+
+            return '\n'.join(lines)
+
+        except Exception as e:
+            return f"加载提交记录失败: {str(e)}"
+
+
 class RepoDetailDialog(QDialog):
     """仓库详情对话框"""
 
@@ -24,6 +92,7 @@ class RepoDetailDialog(QDialog):
         """
         super().__init__(parent)
         self.repo_config = repo_config or {}
+        self._fetch_task = None
 
         self.init_ui()
         self.load_details()
@@ -102,54 +171,20 @@ class RepoDetailDialog(QDialog):
         self.load_recent_commits()
 
     def load_recent_commits(self):
-        """加载最近提交记录"""
-        try:
-            repo_path = self.repo_config.get('path', '')
-            if not repo_path:
-                self.commits_text.setPlainText("仓库路径未配置")
-                return
-
-            # 创建 GitService
-            git_service = GitService(repo_path)
-
-            # 获取最近7天的提交
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=7)
-
-            author_name = self.repo_config.get('author_name')
-            author_email = self.repo_config.get('author_email')
-
-            commits = git_service.get_commits(
-                author_name=author_name if author_name else None,
-                author_email=author_email if author_email else None,
-                start_date=start_date,
-                end_date=end_date
-            )
-
-            # 限制显示最多5条
-            commits = commits[:5]
-
-            if not commits:
-                self.commits_text.setPlainText("最近7天没有提交记录")
-                return
-
-            # 格式化显示
-            lines = []
-            lines.append(f"共找到 {len(commits)} 条提交 (显示最新5条):\n")
-
-            for commit in commits:
-                date_str = commit.date.strftime('%Y-%m-%d %H:%M')
-                message = commit.message.split('\n')[0]  # 只显示第一行
-                if len(message) > 60:
-                    message = message[:60] + '...'
-
-                lines.append(f"[{date_str}]")
-                lines.append(f"  {commit.author} <{commit.email}>")
-                lines.append(f"  {message}")
-                lines.append(f"  Hash: {commit.hash[:8]}")
-                lines.append("")
-
-            self.commits_text.setPlainText('\n'.join(lines))
-
-        except Exception as e:
-            self.commits_text.setPlainText(f"加载提交记录失败: {str(e)}")
+        """加载最近提交记录(在线程池中执行,避免阻塞界面)"""
+        repo_path = self.repo_config.get('path', '')
+        if not repo_path:
+            self.commits_text.setPlainText("仓库路径未配置")
+            return
+
+        self.commits_text.setPlainText("加载中...")
+
+        self._fetch_task = _FetchTask(self.repo_config)
+        self._fetch_task.signals.finished.connect(self._on_commits_ready)
+        QThreadPool.globalInstance().start(self._fetch_task)
+
+    @Slot(str)
+    def _on_commits_ready(self, text: str):
+        """最近提交加载完成"""
+        self.commits_text.setPlainText(text)
+        self._fetch_task = None
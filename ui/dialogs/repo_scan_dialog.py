@@ -3,42 +3,75 @@
 批量扫描并添加Git仓库
 """
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
+from operator import attrgetter, itemgetter
+from typing import Dict, List
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QTreeWidget, QTreeWidgetItem, QSpinBox,
+    QPushButton, QTreeWidget, QTreeWidgetItem, QTreeWidgetItemIterator, QSpinBox,
     QFileDialog, QMessageBox, QLineEdit, QProgressBar, QCheckBox
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import (
+    Qt, QThread, QTimer, Signal, Slot, QSignalBlocker,
+    QObject, QRunnable, QThreadPool
+)
 from core.services.repo_scanner import RepoScanner, RepoInfo
+from infrastructure.logger import get_logger
+
+logger = get_logger()
+
+
+def _norm(path) -> str:
+    """规范化路径用于比较(Windows 下不区分大小写,POSIX 下保持原样)"""
+    return os.path.normcase(os.path.normpath(os.fspath(path)))
+
+
+# 仓库项上记录的上一次勾选状态(bool),用于增量维护选中数量
+CHECK_STATE_ROLE = Qt.UserRole + 1
 
 
 class ScanThread(QThread):
     """后台扫描线程"""
     progress = Signal(int, int)  # repos_found, dirs_scanned
-    finished = Signal(list)  # List[RepoInfo]
+    finished = Signal(list, dict)  # List[RepoInfo], {父目录: List[RepoInfo]}(均已排序)
     error = Signal(str)
 
-    def __init__(self, root_path: str, max_depth: int):
+    def __init__(self, root_path: str, max_depth: int, existing_paths: List[str] = None):
         super().__init__()
         self.root_path = root_path
         self.max_depth = max_depth
+        self.existing_paths = list(existing_paths or [])  # 已添加仓库的路径
         self.scanner = RepoScanner()
 
     def run(self):
         """执行扫描"""
         try:
-            # 定期更新进度
-            import time
-            last_update = time.time()
-
             repos = self.scanner.scan_directory(self.root_path, self.max_depth)
 
+            # 在后台线程预先计算界面需要的字段,减少界面线程的工作
+            existing = {_norm(p) for p in self.existing_paths}
+            for repo in repos:
+                if repo.author_name or repo.author_email:
+                    repo.display_author = f"{repo.author_name} <{repo.author_email}>"
+                repo.normalized_path = _norm(repo.path)
+                repo.is_added = repo.normalized_path in existing
+
+            # 按父目录分组,目录和目录内的仓库都预先排好序
+            groups = {}
+            for repo in repos:
+                groups.setdefault(repo.parent_path, []).append(repo)
+            by_name = attrgetter('name')
+            for repo_list in groups.values():
+                repo_list.sort(key=by_name)
+            # 只按目录键排序,界面线程直接按插入顺序遍历,无需再排序
+            repos_by_parent = dict(sorted(groups.items(), key=itemgetter(0)))
+
             # 发送最终进度
             repos_count, dirs_count = self.scanner.get_progress()
             self.progress.emit(repos_count, dirs_count)
 
-            self.finished.emit(repos)
+            self.finished.emit(repos, repos_by_parent)
         except Exception as e:
             self.error.emit(str(e))
 
@@ -47,6 +80,37 @@ class ScanThread(QThread):
         self.scanner.stop()
 
 
+class _ValidateSignals(QObject):
+    """仓库校验任务的信号"""
+    finished = Signal(list, list)  # 有效仓库, 无效仓库
+
+
+class _ValidateTask(QRunnable):
+    """并行校验选中仓库是否仍为有效 Git 仓库的任务"""
+
+    MAX_WORKERS = 8
+
+    def __init__(self, repos: List[RepoInfo]):
+        super().__init__()
+        self.repos = list(repos)
+        self.signals = _ValidateSignals()
+
+    @staticmethod
+    def _is_valid(repo: RepoInfo) -> bool:
+        """仓库目录及其 .git 目录是否仍然存在"""
+        return os.path.isdir(os.path.join(repo.path, '.git'))
+
+    def run(self):
+        """执行校验"""
+        workers = max(1, min(len(self.repos), self.MAX_WORKERS))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._is_valid, self.repos))
+
+        valid = [repo for repo, ok in zip(self.repos, results) if ok]
+        invalid = [repo for repo, ok in zip(self.repos, results) if not ok]
+        self.signals.finished.emit(valid, invalid)
+
+
 class RepoScanDialog(QDialog):
     """仓库扫描对话框"""
 
@@ -61,8 +125,18 @@ class RepoScanDialog(QDialog):
         super().__init__(parent)
         self.config_manager = config_manager
         self.scan_thread = None
-        self.scanned_repos = []  # 扫描到的所有仓库
-        self.repo_items = {}  # path -> QTreeWidgetItem 映射
+        # 按行号平行存放的仓库项数据(仓库信息通过 Qt.UserRole 存放在各项上)
+        self._items = []  # 仓库项(QTreeWidgetItem)
+        self._enabled = bytearray()  # 是否可勾选(未添加过)
+        self._item_pool = {}  # path -> QTreeWidgetItem,重新扫描时复用的仓库项
+        self._validate_task = None  # 进行中的仓库校验任务
+        self._stats_dirty = False  # 是否已安排选中统计更新
+        self._selected_count = 0  # 当前选中的仓库数量
+
+        # 扫描期间定时读取扫描进度(扫描在后台线程中进行,界面不被阻塞)
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(200)
+        self._progress_timer.timeout.connect(self._poll_scan_progress)
 
         self.init_ui()
 
@@ -138,6 +212,8 @@ class RepoScanDialog(QDialog):
         self.tree_widget.setColumnWidth(0, 200)
         self.tree_widget.setColumnWidth(1, 300)
         self.tree_widget.setColumnWidth(2, 200)
+        # 所有行等高,视图无需逐行计算尺寸,大量结果时布局和滚动开销只与可见行相关
+        self.tree_widget.setUniformRowHeights(True)
         self.tree_widget.itemChanged.connect(self.on_item_changed)
         layout.addWidget(self.tree_widget)
 
@@ -185,10 +261,9 @@ class RepoScanDialog(QDialog):
             QMessageBox.warning(self, "路径错误", f"目录不存在: {root_path}")
             return
 
-        # 清空之前的结果
-        self.tree_widget.clear()
-        self.scanned_repos = []
-        self.repo_items = {}
+        # 清空之前的结果(仓库项移入对象池,重新扫描时复用)
+        self._recycle_items()
+        self._reset_results()
 
         # 禁用控件
         self.scan_btn.setEnabled(False)
@@ -198,27 +273,62 @@ class RepoScanDialog(QDialog):
 
         # 创建并启动扫描线程
         max_depth = self.depth_spin.value()
-        self.scan_thread = ScanThread(root_path, max_depth)
+        existing_paths = [r.get('path', '') for r in self.config_manager.get_repos()]
+        self.scan_thread = ScanThread(root_path, max_depth, existing_paths)
         self.scan_thread.progress.connect(self.on_scan_progress)
         self.scan_thread.finished.connect(self.on_scan_finished)
         self.scan_thread.error.connect(self.on_scan_error)
         self.scan_thread.start()
+        self._progress_timer.start()
 
         self.progress_label.setText("正在扫描...")
 
+    def _recycle_items(self):
+        """将当前结果中的仓库项移出树并放入对象池"""
+        pool = self._item_pool
+        with QSignalBlocker(self.tree_widget):
+            for parent_item in self.tree_widget.invisibleRootItem().takeChildren():
+                for child in parent_item.takeChildren():
+                    repo = child.data(0, Qt.UserRole)
+                    if repo is not None:
+                        pool[repo.path] = child
+
+    def _reset_results(self):
+        """清空结果的行数据和选中数量"""
+        self._items = []
+        self._enabled = bytearray()
+        self._selected_count = 0
+
+    def _discard_results(self):
+        """扫描无结果或失败时丢弃对象池和结果数据,下次扫描从干净状态开始"""
+        self._item_pool.clear()
+        self._reset_results()
+        self.update_selection_stats()
+
     def stop_scan(self):
         """停止扫描"""
         if self.scan_thread:
             self.scan_thread.stop()
             self.progress_label.setText("正在停止...")
 
+    def _poll_scan_progress(self):
+        """读取后台扫描的当前进度"""
+        if self.scan_thread is not None and self.scan_thread.isRunning():
+            self.on_scan_progress(*self.scan_thread.scanner.get_progress())
+
     def on_scan_progress(self, repos_found: int, dirs_scanned: int):
         """扫描进度更新"""
         self.progress_label.setText(f"正在扫描... 已找到 {repos_found} 个仓库, 已扫描 {dirs_scanned} 个目录")
 
-    def on_scan_finished(self, repos: List[RepoInfo]):
-        """扫描完成"""
-        self.scanned_repos = repos
+    def on_scan_finished(self, repos: List[RepoInfo], repos_by_parent: Dict[str, List[RepoInfo]]):
+        """
+        扫描完成
+
+        Args:
+            repos: 扫描到的所有仓库
+            repos_by_parent: 按父目录分组的仓库(已排序)
+        """
+        self._progress_timer.stop()
 
         # 恢复控件
         self.scan_btn.setEnabled(True)
@@ -227,62 +337,86 @@ class RepoScanDialog(QDialog):
         self.depth_spin.setEnabled(True)
 
         if not repos:
+            self._discard_results()
             self.progress_label.setText("未找到任何 Git 仓库")
             QMessageBox.information(self, "扫描完成", "未找到任何 Git 仓库")
             return
 
-        # 获取已添加的仓库路径
-        existing_repos = self.config_manager.get_repos()
-        existing_paths = set(os.path.normpath(r['path']).lower() for r in existing_repos)
-
-        # 按目录分组
-        repos_by_parent = {}
-        for repo in repos:
-            parent = repo.parent_path
-            if parent not in repos_by_parent:
-                repos_by_parent[parent] = []
-            repos_by_parent[parent].append(repo)
-
-        # 构建树形结构
-        for parent_path in sorted(repos_by_parent.keys()):
-            parent_item = QTreeWidgetItem(self.tree_widget)
-            parent_item.setText(0, parent_path)
-            parent_item.setExpanded(True)
-            parent_item.setFlags(parent_item.flags() & ~Qt.ItemIsUserCheckable)
-
-            for repo in sorted(repos_by_parent[parent_path], key=lambda r: r.name):
-                # 检查是否已添加
-                normalized_path = os.path.normpath(repo.path).lower()
-                is_added = normalized_path in existing_paths
-
-                # 创建仓库项
-                repo_item = QTreeWidgetItem(parent_item)
-                repo_item.setText(0, repo.name)
-                repo_item.setText(1, repo.path)
-
-                # 作者信息
-                author_info = ""
-                if repo.author_name or repo.author_email:
-                    author_info = f"{repo.author_name} <{repo.author_email}>"
-                repo_item.setText(2, author_info)
-
-                # 状态
-                if is_added:
-                    repo_item.setText(3, "已添加")
-                    repo_item.setCheckState(0, Qt.Unchecked)
-                    repo_item.setFlags(repo_item.flags() & ~Qt.ItemIsEnabled)
-                    # 灰色显示
-                    for col in range(4):
-                        repo_item.setForeground(col, Qt.gray)
-                else:
-                    repo_item.setText(3, "")
-                    repo_item.setCheckState(0, Qt.Checked)  # 默认选中
-
-                # 保存映射
-                self.repo_items[repo.path] = repo_item
+        # 循环中使用的常量预先绑定为局部变量
+        checked = Qt.Checked
+        unchecked = Qt.Unchecked
+        user_role = Qt.UserRole
+        foreground_role = Qt.ForegroundRole
+        item_enabled = Qt.ItemIsEnabled
+        gray = Qt.gray
+        take_pooled = self._item_pool.pop
+
+        # 构建树形结构(批量填充期间暂停重绘并屏蔽 itemChanged 信号)
+        items = []
+        enabled = bytearray()
+        new_count = 0  # 未添加过的仓库数(默认全部选中)
+        self.tree_widget.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.tree_widget):
+                for parent_path, repo_list in repos_by_parent.items():
+                    parent_item = QTreeWidgetItem(self.tree_widget)
+                    parent_item.setText(0, parent_path)
+                    parent_item.setFlags(parent_item.flags() & ~Qt.ItemIsUserCheckable)
+
+                    children = []
+                    for repo in repo_list:
+                        # 是否已添加(扫描线程中已判断)
+                        is_added = repo.is_added
+
+                        # 各列文本: 仓库, 路径, 作者信息, 状态
+                        texts = [repo.name, repo.path, repo.display_author, "已添加" if is_added else ""]
+
+                        # 优先复用上次扫描的同路径仓库项,否则新建(先不挂到父节点,最后一次性添加)
+                        repo_item = take_pooled(repo.path, None)
+                        if repo_item is None:
+                            # 一次构造调用设置所有列的文本
+                            repo_item = QTreeWidgetItem(texts)
+                        else:
+                            # 恢复为默认的可用、非灰色状态
+                            repo_item.setFlags(repo_item.flags() | item_enabled)
+                            for col, text in enumerate(texts):
+                                repo_item.setText(col, text)
+                                repo_item.setData(col, foreground_role, None)
+
+                        # 状态
+                        if is_added:
+                            repo_item.setCheckState(0, unchecked)
+                            repo_item.setFlags(repo_item.flags() & ~item_enabled)
+                            # 灰色显示
+                            for col in range(4):
+                                repo_item.setForeground(col, gray)
+                        else:
+                            repo_item.setCheckState(0, checked)  # 默认选中
+
+                        # 关联仓库信息,记录初始勾选状态
+                        repo_item.setData(0, user_role, repo)
+                        repo_item.setData(0, CHECK_STATE_ROLE, not is_added)
+                        if not is_added:
+                            new_count += 1
+
+                        # 按行保存
+                        items.append(repo_item)
+                        enabled.append(0 if is_added else 1)
+                        children.append(repo_item)
+
+                    parent_item.addChildren(children)
+                    parent_item.setExpanded(True)
+        finally:
+            self.tree_widget.setUpdatesEnabled(True)
+
+        # 本次扫描未复用的仓库项不再需要
+        self._item_pool.clear()
+
+        self._items = items
+        self._enabled = enabled
+        self._selected_count = new_count
 
         # 更新统计
-        new_count = len([r for r in repos if os.path.normpath(r.path).lower() not in existing_paths])
         added_count = len(repos) - new_count
 
         self.result_label.setText(f"找到的仓库 ({len(repos)} 个, 已添加 {added_count} 个):")
@@ -298,83 +432,150 @@ class RepoScanDialog(QDialog):
 
     def on_scan_error(self, error_msg: str):
         """扫描出错"""
+        self._progress_timer.stop()
+
         # 恢复控件
         self.scan_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.path_input.setEnabled(True)
         self.depth_spin.setEnabled(True)
 
+        self._discard_results()
         self.progress_label.setText(f"扫描失败: {error_msg}")
         QMessageBox.critical(self, "扫描失败", f"扫描目录时出错:\n{error_msg}")
 
+    def reject(self):
+        """关闭对话框时停止仍在进行的扫描"""
+        self._progress_timer.stop()
+        if self.scan_thread is not None and self.scan_thread.isRunning():
+            self.scan_thread.stop()
+            self.scan_thread.wait()
+        super().reject()
+
     def on_item_changed(self, item: QTreeWidgetItem, column: int):
         """树形项改变时更新统计"""
-        if column == 0:  # 复选框列
-            self.update_selection_stats()
+        if column != 0:  # 只关心复选框列
+            return
 
-    def update_selection_stats(self):
-        """更新选中统计"""
-        selected_count = 0
+        previous = item.data(0, CHECK_STATE_ROLE)
+        if previous is None:  # 目录节点没有勾选状态
+            return
 
-        for repo in self.scanned_repos:
-            item = self.repo_items.get(repo.path)
-            if item and item.checkState(0) == Qt.Checked:
-                selected_count += 1
+        is_checked = item.checkState(0) == Qt.Checked
+        if is_checked == previous:  # 勾选状态未变化(如其他数据变化),无需更新
+            return
 
-        self.stats_label.setText(f"已选中: {selected_count} 个仓库")
+        self._selected_count += 1 if is_checked else -1
+        # 记录新状态时不再触发 itemChanged
+        with QSignalBlocker(self.tree_widget):
+            item.setData(0, CHECK_STATE_ROLE, is_checked)
+        self._schedule_stats_update()
+
+    def _schedule_stats_update(self):
+        """安排一次延迟的统计更新,合并连续的多次勾选变化"""
+        if self._stats_dirty:
+            return
+        self._stats_dirty = True
+        QTimer.singleShot(0, self._do_stats_update)
+
+    def _do_stats_update(self):
+        """执行延迟的统计更新"""
+        self._stats_dirty = False
+        self.update_selection_stats()
+
+    def update_selection_stats(self):
+        """更新选中统计"""
+        self.stats_label.setText(f"已选中: {self._selected_count} 个仓库")
 
     def select_all(self):
         """全选"""
-        for repo in self.scanned_repos:
-            item = self.repo_items.get(repo.path)
-            if item and (item.flags() & Qt.ItemIsEnabled):
-                item.setCheckState(0, Qt.Checked)
+        checked = Qt.Checked
+        with QSignalBlocker(self.tree_widget):
+            # 只遍历可勾选的仓库项,跳过已添加的项
+            for item in compress(self._items, self._enabled):
+                item.setCheckState(0, checked)
+                item.setData(0, CHECK_STATE_ROLE, True)
+
+        # 所有可勾选的仓库都被选中
+        self._selected_count = sum(self._enabled)
+        self.update_selection_stats()
 
     def deselect_all(self):
         """取消全选"""
-        for repo in self.scanned_repos:
-            item = self.repo_items.get(repo.path)
-            if item and (item.flags() & Qt.ItemIsEnabled):
-                item.setCheckState(0, Qt.Unchecked)
+        unchecked = Qt.Unchecked
+        with QSignalBlocker(self.tree_widget):
+            for item in compress(self._items, self._enabled):
+                item.setCheckState(0, unchecked)
+                item.setData(0, CHECK_STATE_ROLE, False)
+
+        # 已添加的仓库始终不选中,取消全选后没有选中项
+        self._selected_count = 0
+        self.update_selection_stats()
 
     def add_selected_repos(self):
-        """添加选中的仓库"""
+        """添加选中的仓库(先在线程池中并行校验仓库路径)"""
         # 获取选中的仓库
         selected_repos = []
-        for repo in self.scanned_repos:
-            item = self.repo_items.get(repo.path)
-            if item and item.checkState(0) == Qt.Checked:
+        it = QTreeWidgetItemIterator(self.tree_widget, QTreeWidgetItemIterator.Checked)
+        while it.value():
+            repo = it.value().data(0, Qt.UserRole)
+            if repo is not None:
                 selected_repos.append(repo)
+            it += 1
 
         if not selected_repos:
             QMessageBox.warning(self, "未选择", "请至少选择一个仓库")
             return
 
+        self.add_btn.setEnabled(False)
+        self.progress_label.setText(f"正在校验 {len(selected_repos)} 个仓库...")
+
+        self._validate_task = _ValidateTask(selected_repos)
+        self._validate_task.signals.finished.connect(self._on_repos_validated)
+        QThreadPool.globalInstance().start(self._validate_task)
+
+    @Slot(list, list)
+    def _on_repos_validated(self, valid_repos: List[RepoInfo], invalid_repos: List[RepoInfo]):
+        """
+        校验完成后批量添加仓库
+
+        Args:
+            valid_repos: 校验通过的仓库
+            invalid_repos: 已不是有效 Git 仓库的仓库
+        """
+        self._validate_task = None
+        self.add_btn.setEnabled(True)
+        selected_count = len(valid_repos) + len(invalid_repos)
+        for repo in invalid_repos:
+            logger.warning(f"添加仓库失败 ({repo.path}): 不是有效的 Git 仓库")
+
         # 批量添加
-        added_count = 0
-        for repo in selected_repos:
-            try:
-                self.config_manager.add_repo(
-                    name=repo.name,
-                    path=repo.path,
-                    author_name=repo.author_name,
-                    author_email=repo.author_email,
-                    enabled=True
-                )
-                added_count += 1
-            except Exception as e:
-                print(f"添加仓库失败 ({repo.path}): {e}")
+        entries = [
+            dict(
+                name=repo.name,
+                path=repo.path,
+                author_name=repo.author_name,
+                author_email=repo.author_email,
+                enabled=True
+            )
+            for repo in valid_repos
+        ]
+        try:
+            added_count = len(self.config_manager.add_repos_bulk(entries))
+        except Exception as e:
+            added_count = 0
+            logger.error(f"批量添加仓库失败: {e}", exc_info=True)
 
         # 保存配置
         if added_count > 0:
             self.config_manager.save_config()
 
         # 显示结果
-        if added_count == len(selected_repos):
+        if added_count == selected_count:
             QMessageBox.information(self, "成功", f"成功添加 {added_count} 个仓库")
             self.accept()
         else:
-            failed_count = len(selected_repos) - added_count
+            failed_count = selected_count - added_count
             QMessageBox.warning(
                 self,
                 "部分成功",
@@ -1,46 +1,117 @@
 """
 主窗口 UI 模块
 """
+import html
 import os
-import time
+import re
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
 from datetime import datetime, timedelta
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QFileDialog, QTableWidget, QTableWidgetItem, QDialog,
     QHeaderView, QApplication, QStatusBar, QLabel
 )
-from PySide6.QtCore import Qt, QDate, QThread, Signal
-from PySide6.QtGui import QFont, QCursor, QIcon
+from PySide6.QtCore import Qt, QDate, QThread, QTimer, Signal, Slot, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QFont, QIcon
 from qfluentwidgets import (
     PushButton, PrimaryPushButton, BodyLabel, SubtitleLabel,
     MessageBox, InfoBar, InfoBarPosition, TextBrowser
 )
-import markdown2
 
 from infrastructure.config_manager import ConfigManager
 from core.services.git_service import GitService, CommitRecord
 from core.services.formatter import DataFormatter
 from infrastructure.ai_client import AiClientFactory
 from infrastructure.logger import get_logger
-from ui.dialogs.ai_config_dialog import AIConfigDialog
 from ui.widgets.repo_list_widget import RepoListWidget
 from ui.widgets.date_range_picker import DateRangePickerWidget
-from ui.themes.theme_manager import ThemeManager
+from ui.themes.theme_manager import ThemeManager, get_cursor
 from ui.themes.icons import Icons
 from ui.dialogs.progress_dialog import ProgressDialog
-from ui.dialogs.commit_log_dialog import CommitLogDialog
 from utils.resource_path import get_resource_path
 
 logger = get_logger()
 
+# 复用同一个 Markdown 转换器(break-on-newline 让单个换行直接转为 <br />)
+# 首次生成报告时才导入 markdown2 并创建,减少启动耗时
+_MARKDOWN = None
+# 转换器实例带有状态,主线程和线程池可能同时使用,需要串行化
+_MARKDOWN_LOCK = threading.Lock()
+
+# 粗略判断文本中是否含有 Markdown 语法(标题、强调、代码、链接、表格、列表)
+_MD_SNIFF = re.compile(r'[#*`\[|_]|^\s*[-+>]\s|^\s*\d+\.\s', re.M)
+
+# 超过此长度的报告按标题拆分后分段转换,避免解析器在大文本上变慢
+_SPLIT_THRESHOLD = 20_000
+_HEADING_SPLIT = re.compile(r'(?=^#{1,3} )', re.M)
+
+
+def render_report_html(report_text: str) -> str:
+    """
+    将 Markdown 报告转换为 HTML
+
+    Args:
+        report_text: Markdown 格式的报告
+
+    Returns:
+        HTML 内容
+    """
+    if not _MD_SNIFF.search(report_text):
+        # 纯文本无需经过 Markdown 解析,转义后保留换行即可
+        return '<p>' + html.escape(report_text).replace('\n', '<br />\n') + '</p>'
+
+    global _MARKDOWN
+    with _MARKDOWN_LOCK:
+        if _MARKDOWN is None:
+            import markdown2
+            _MARKDOWN = markdown2.Markdown(extras=['break-on-newline', 'fenced-code-blocks', 'tables'])
+
+        # 代码块中可能出现以 # 开头的行,含代码块时不拆分
+        if len(report_text) > _SPLIT_THRESHOLD and '```' not in report_text:
+            chunks = _HEADING_SPLIT.split(report_text)
+            return ''.join(str(_MARKDOWN.convert(chunk)) for chunk in chunks if chunk)
+        return str(_MARKDOWN.convert(report_text))
+
+
+class _RenderSignals(QObject):
+    """报告渲染任务的信号"""
+    finished = Signal(str, str)  # 报告原文, HTML
+
+
+class _RenderTask(QRunnable):
+    """在线程池中把报告转换为 HTML 的任务"""
+
+    def __init__(self, report_text: str):
+        super().__init__()
+        self.report_text = report_text
+        self.signals = _RenderSignals()
+
+    def run(self):
+        """执行转换"""
+        try:
+            html_content = render_report_html(self.report_text)
+        except Exception as e:
+            logger.error(f"报告渲染失败: {e}", exc_info=True)
+            html_content = ""
+        self.signals.finished.emit(self.report_text, html_content)
+
 
 class ReportDialog(QDialog):
     """报告展示对话框"""
 
-    def __init__(self, report_text: str, parent=None):
+    def __init__(self, report_text: str, parent=None, report_html: str = None):
+        """
+        Args:
+            report_text: Markdown 格式的报告
+            parent: 父窗口
+            report_html: 已转换好的 HTML,提供时不再重复转换
+        """
         super().__init__(parent)
         self.report_text = report_text
+        self.report_html = report_html
         self.init_ui()
 
     def init_ui(self):
@@ -54,10 +125,10 @@ class ReportDialog(QDialog):
         self.text_browser = TextBrowser()
         self.text_browser.setFont(QFont("Microsoft YaHei", 10))
 
-        # 转换 Markdown 为 HTML
-        # 处理换行符：在单个换行符后添加两个空格以强制换行
-        processed_text = self.report_text.replace('\n', '  \n')
-        html_content = markdown2.markdown(processed_text)
+        # 转换 Markdown 为 HTML(已有缓存时直接使用)
+        html_content = self.report_html
+        if not html_content:
+            html_content = render_report_html(self.report_text)
         self.text_browser.setHtml(html_content)
 
         layout.addWidget(self.text_browser)
@@ -99,68 +170,99 @@ class FetchCommitsThread(QThread):
     error = Signal(str)
     progress_updated = Signal(int, str)  # 进度百分比, 步骤描述
 
-    def __init__(self, config_manager, start_datetime, end_datetime):
+    MAX_WORKERS = 8  # 并行拉取的最大仓库数
+
+    def __init__(self, enabled_repos, start_datetime, end_datetime):
         super().__init__()
-        self.config_manager = config_manager
+        self.enabled_repos = tuple(enabled_repos)  # 不可变,可安全地在线程间共享
         self.start_datetime = start_datetime
         self.end_datetime = end_datetime
+        self._last_emit_ts = 0.0  # 上次发送进度的时间(time.monotonic)
+        self._last_pct = -1  # 上次发送的进度
+
+    def _emit_progress(self, pct: int, text: str, force: bool = False):
+        """
+        发送进度(节流:进度有变化且距上次发送至少 100ms,force 时总是发送)
+
+        Args:
+            pct: 进度百分比
+            text: 步骤描述
+            force: 是否跳过节流
+        """
+        now = time.monotonic()
+        if not force and (pct == self._last_pct or now - self._last_emit_ts < 0.1):
+            return
+        self._last_emit_ts = now
+        self._last_pct = pct
+        self.progress_updated.emit(pct, text)
+
+    def _fetch_one(self, repo: dict):
+        """
+        拉取单个仓库的提交记录(在线程池中执行)
+
+        Args:
+            repo: 仓库配置
+
+        Returns:
+            (仓库名称, 提交列表或 None, 错误或 None)
+        """
+        repo_name = repo.get('name', '未知仓库')
+        try:
+            # 创建 GitService
+            git_service = GitService(repo.get('path', ''), repo_name)
+
+            # 拉取该仓库的提交
+            commits = git_service.get_commits(
+                author_name=repo.get('author_name') or None,
+                author_email=repo.get('author_email') or None,
+                start_date=self.start_datetime,
+                end_date=self.end_datetime
+            )
+            return repo_name, commits, None
+        except Exception as e:
+            return repo_name, None, e
 
     def run(self):
         """执行拉取操作"""
         try:
-            # 获取所有已启用的仓库
-            enabled_repos = self.config_manager.get_enabled_repos()
-
-            if not enabled_repos:
-                self.error.emit("请先添加并启用至少一个仓库")
-                return
-
-            self.progress_updated.emit(10, f"准备拉取 {len(enabled_repos)} 个仓库...")
-            time.sleep(0.3)
+            enabled_repos = self.enabled_repos
+            total = len(enabled_repos)
+            self._emit_progress(10, f"准备拉取 {total} 个仓库...", force=True)
 
             # 汇总所有仓库的提交
             all_commits = []
-            failed_repos = []
+            failed = {}  # 仓库序号 -> 错误信息,最后按仓库顺序输出
 
             # 计算每个仓库的进度占比
-            progress_per_repo = 80 / len(enabled_repos)  # 10%-90%之间分配给各仓库
-
-            for idx, repo in enumerate(enabled_repos):
-                repo_name = repo.get('name', '未知仓库')
-                repo_path = repo.get('path', '')
-                author_name = repo.get('author_name') or None
-                author_email = repo.get('author_email') or None
-
-                # 更新进度
-                current_progress = 10 + int(idx * progress_per_repo)
-                self.progress_updated.emit(current_progress, f"正在拉取: {repo_name}...")
-
-                try:
-                    # 创建 GitService
-                    git_service = GitService(repo_path, repo_name)
-
-                    # 拉取该仓库的提交
-                    commits = git_service.get_commits(
-                        author_name=author_name,
-                        author_email=author_email,
-                        start_date=self.start_datetime,
-                        end_date=self.end_datetime
-                    )
-
-                    all_commits.extend(commits)
-                    logger.info(f"仓库 {repo_name} 拉取成功: {len(commits)} 条提交")
-
-                except Exception as e:
-                    error_msg = f"{repo_name}: {str(e)}"
-                    failed_repos.append(error_msg)
-                    logger.error(f"仓库 {repo_name} 拉取失败: {e}")
+            progress_per_repo = 80 / total  # 10%-90%之间分配给各仓库
+
+            # 各仓库的拉取互不依赖,并行执行,结果在本线程按完成顺序汇总
+            with ThreadPoolExecutor(max_workers=min(total, self.MAX_WORKERS)) as executor:
+                futures = {
+                    executor.submit(self._fetch_one, repo): idx
+                    for idx, repo in enumerate(enabled_repos)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    repo_name, commits, error = future.result()
+
+                    if error is None:
+                        all_commits.extend(commits)
+                        logger.info(f"仓库 {repo_name} 拉取成功: {len(commits)} 条提交")
+                    else:
+                        failed[futures[future]] = f"{repo_name}: {str(error)}"
+                        logger.error(f"仓库 {repo_name} 拉取失败: {error}")
+
+                    # 更新进度
+                    current_progress = 10 + int(done * progress_per_repo)
+                    self._emit_progress(current_progress, f"已拉取 {done}/{total}: {repo_name}")
+
+            failed_repos = [failed[idx] for idx in sorted(failed)]
 
             # 排序
-            self.progress_updated.emit(90, "正在排序提交记录...")
-            all_commits.sort(key=lambda c: c.date, reverse=True)
-            time.sleep(0.2)
+            self._emit_progress(90, "正在排序提交记录...", force=True)
+            all_commits.sort(key=attrgetter('date'), reverse=True)
 
-            self.progress_updated.emit(100, "完成!")
+            self._emit_progress(100, "完成!", force=True)
             self.finished.emit(all_commits, failed_repos)
 
         except Exception as e:
@@ -172,73 +274,99 @@ class GenerateReportThread(QThread):
     """生成报告的后台线程"""
     finished = Signal(str)
     error = Signal(str)
+    config_error = Signal(str)  # AI 配置错误(例如未配置 API Key)
     progress_updated = Signal(int, str)  # 进度百分比, 步骤描述
 
-    def __init__(self, ai_client, commit_summary):
+    tick_requested = Signal(int, int)  # 起始进度, 最大进度:开始模拟进度增长
+    tick_stop = Signal()  # 停止模拟进度
+
+    def __init__(self, config_manager, commits):
         super().__init__()
-        self.ai_client = ai_client
-        self.commit_summary = commit_summary
-        self.current_progress = 0
+        self.config_manager = config_manager
+        self.commits = commits
+        self.token_usage = None  # 生成完成后的 Token 用量统计
         self.max_progress = 88  # 最大模拟到88%,避免到达90%前AI还没响应
-        self.timer_running = False
-        self.timer_thread = None
-
-    def _simulate_progress(self):
-        """定时器回调:模拟进度增长"""
-        while self.timer_running and self.current_progress < self.max_progress:
-            time.sleep(0.5)  # 每0.5秒更新一次
-            if self.timer_running:  # 再次检查，确保在sleep期间没有被停止
-                self.current_progress += 1
-                self.progress_updated.emit(self.current_progress, "等待AI响应中...")
-
-    def _start_progress_timer(self):
-        """启动进度模拟定时器"""
-        self.timer_running = True
-        self.timer_thread = threading.Thread(target=self._simulate_progress, daemon=True)
-        self.timer_thread.start()
-
-    def _stop_progress_timer(self):
-        """停止进度模拟定时器"""
-        self.timer_running = False
-        if self.timer_thread:
-            self.timer_thread.join(timeout=1)  # 等待线程结束，最多1秒
-            self.timer_thread = None
 
     def run(self):
-        """执行报告生成"""
+        """执行报告生成(格式化提交记录和创建AI客户端也在后台线程中完成)"""
         try:
+            # 格式化提交记录
+            self.progress_updated.emit(10, "正在格式化提交记录...")
+            commit_summary = DataFormatter().format_commits(self.commits)
+            logger.info(f"格式化完成, 提交记录长度: {len(commit_summary)}字符")
+            if not commit_summary.strip():
+                self.error.emit("没有可用于生成报告的提交记录")
+                return
+
+            # 创建 AI 客户端
+            self.progress_updated.emit(20, "正在创建AI客户端...")
+            try:
+                ai_client = AiClientFactory.create(self.config_manager)
+            except ValueError as e:
+                self.config_error.emit(str(e))
+                return
+
             self.progress_updated.emit(40, "正在调用AI API...")
-            time.sleep(0.5)  # 让用户能看到进度更新
 
-            # 启动进度模拟定时器(每0.5秒增加1%)
-            self.current_progress = 60
+            # 请求界面线程开始模拟进度(每0.5秒增加1%)
             self.progress_updated.emit(60, "等待AI响应中...")
-            self._start_progress_timer()
-
-            # 调用AI生成报告(耗时操作)
-            report = self.ai_client.generate_report(self.commit_summary)
+            self.tick_requested.emit(60, self.max_progress)
 
-            # 停止进度模拟
-            self._stop_progress_timer()
+            try:
+                # 调用AI生成报告(耗时操作)
+                report = ai_client.generate_report(commit_summary)
+            finally:
+                # 停止进度模拟(发生错误时也要停止)
+                self.tick_stop.emit()
 
             self.progress_updated.emit(90, "处理响应数据...")
-            time.sleep(0.3)
+            self.token_usage = ai_client.get_token_usage()
 
             self.finished.emit(report)
         except Exception as e:
-            # 发生错误时也要停止定时器
-            self._stop_progress_timer()
             self.error.emit(str(e))
 
 
 class MainWindow(QMainWindow):
     """主窗口"""
 
+    _APP_ICON = None  # 应用图标缓存(只从磁盘读取一次)
+
+    @classmethod
+    def app_icon(cls) -> QIcon:
+        """
+        获取应用图标(支持打包环境)
+
+        Returns:
+            应用图标,图标文件不存在时为空图标
+        """
+        if cls._APP_ICON is None:
+            icon_path = get_resource_path('app_icon.ico')
+            cls._APP_ICON = QIcon(icon_path) if os.path.exists(icon_path) else QIcon()
+        return cls._APP_ICON
+
     def __init__(self):
         super().__init__()
         self.config_manager = ConfigManager()
         self.commits = []
         self.last_generated_report = None  # 保存最近生成的报告
+        self.last_generated_report_html = None  # 最近报告转换后的 HTML 缓存
+        self._render_task = None  # 进行中的报告渲染任务
+        self._show_report_when_rendered = False  # 渲染完成后是否打开报告对话框
+        self._ai_display_key = None  # AI配置标签上次显示的 (平台, 模型, 是否已配置 Key)
+        self._commits_display_state = None  # 提交记录标签上次显示的状态
+        self._report_display_state = None  # 报告标签上次显示的状态
+        self.fetch_progress_dialog = None  # 拉取进度对话框
+        self.progress_dialog = None  # 生成报告进度对话框
+        self.fetch_thread = None  # 拉取提交记录线程
+        self.report_thread = None  # 生成报告线程
+
+        # 等待AI响应期间的模拟进度(在界面线程中定时增长)
+        self._report_progress = 0
+        self._report_progress_max = 0
+        self._report_tick_timer = QTimer(self)
+        self._report_tick_timer.setInterval(500)
+        self._report_tick_timer.timeout.connect(self._on_report_progress_tick)
         self.init_ui()
         self.load_config()
 
@@ -247,10 +375,8 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Git 提交记录智能报告生成器")
         self.resize(1000, 700)
 
-        # 设置窗口图标（支持打包环境）
-        icon_path = get_resource_path('app_icon.ico')
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        # 设置窗口图标
+        self.setWindowIcon(self.app_icon())
 
         # 中央部件
         central_widget = QWidget()
@@ -272,77 +398,24 @@ class MainWindow(QMainWindow):
         # AI 配置标签（可点击）
         self.ai_config_label = QLabel()
         self.ai_config_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        self.ai_config_label.setStyleSheet("""
-            QLabel {
-                padding: 8px 12px;
-                background-color: #f5f5f5;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-size: 13px;
-                color: #333;
-            }
-            QLabel:hover {
-                background-color: #e8e8e8;
-                border-color: #999;
-            }
-        """)
-        self.ai_config_label.setCursor(QCursor(Qt.PointingHandCursor))
+        ThemeManager.apply_clickable_info_label_style(self.ai_config_label)
+        self.ai_config_label.setCursor(get_cursor(Qt.PointingHandCursor))
         self.ai_config_label.mousePressEvent = lambda e: self.open_ai_config()
         config_layout.addWidget(self.ai_config_label)
 
         # 提交记录标签（可点击）
         self.commits_label = QLabel()
         self.commits_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        self.commits_label.setStyleSheet("""
-            QLabel {
-                padding: 8px 12px;
-                background-color: #f5f5f5;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-size: 13px;
-                color: #333;
-            }
-            QLabel:hover {
-                background-color: #e8e8e8;
-                border-color: #999;
-            }
-            QLabel[enabled="false"] {
-                color: #999;
-            }
-            QLabel[enabled="false"]:hover {
-                background-color: #f5f5f5;
-                border-color: #ddd;
-            }
-        """)
-        self.commits_label.setCursor(QCursor(Qt.PointingHandCursor))
+        ThemeManager.apply_clickable_info_label_style(self.commits_label)
+        self.commits_label.setCursor(get_cursor(Qt.PointingHandCursor))
         self.commits_label.mousePressEvent = lambda e: self.view_commit_log_from_label()
         config_layout.addWidget(self.commits_label)
 
         # 报告查看标签（可点击）
         self.report_view_label = QLabel()
         self.report_view_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        self.report_view_label.setStyleSheet("""
-            QLabel {
-                padding: 8px 12px;
-                background-color: #f5f5f5;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-size: 13px;
-                color: #333;
-            }
-            QLabel:hover {
-                background-color: #e8e8e8;
-                border-color: #999;
-            }
-            QLabel[enabled="false"] {
-                color: #999;
-            }
-            QLabel[enabled="false"]:hover {
-                background-color: #f5f5f5;
-                border-color: #ddd;
-            }
-        """)
-        self.report_view_label.setCursor(QCursor(Qt.PointingHandCursor))
+        ThemeManager.apply_clickable_info_label_style(self.report_view_label)
+        self.report_view_label.setCursor(get_cursor(Qt.PointingHandCursor))
         self.report_view_label.mousePressEvent = lambda e: self.view_last_report()
         config_layout.addWidget(self.report_view_label)
 
@@ -391,6 +464,8 @@ class MainWindow(QMainWindow):
 
     def open_ai_config(self):
         """打开 AI 配置对话框"""
+        from ui.dialogs.ai_config_dialog import AIConfigDialog
+
         dialog = AIConfigDialog(self.config_manager, self)
         if dialog.exec_():
             # 更新AI配置显示
@@ -403,6 +478,11 @@ class MainWindow(QMainWindow):
             model = self.config_manager.get(f'ai.configs.{provider}.model', '')
             api_key = self.config_manager.get(f'ai.configs.{provider}.api_key', '')
 
+            # 配置未变化时无需重新生成文本和提示
+            key = (provider, model, bool(api_key))
+            if key == self._ai_display_key:
+                return
+
             # 平台名称映射
             provider_names = {
                 'openai': 'OpenAI GPT',
@@ -421,10 +501,12 @@ class MainWindow(QMainWindow):
                 self.ai_config_label.setToolTip("点击配置AI服务")
 
             self.ai_config_label.setText(text)
+            self._ai_display_key = key
             logger.info(f"AI配置显示已更新: {text}")
 
         except Exception as e:
             logger.error(f"更新AI配置显示失败: {e}")
+            self._ai_display_key = None
             self.ai_config_label.setText("⚙️ AI配置: 配置错误")
 
 
@@ -437,6 +519,14 @@ class MainWindow(QMainWindow):
             MessageBox("警告", "请先添加并启用至少一个仓库", self).exec()
             return
 
+        # 获取日期范围(日期范围无效时不启动后台线程)
+        start_date, end_date = self.date_range_picker.get_date_range_python()
+        start_datetime = datetime.combine(start_date, datetime.min.time())
+        end_datetime = datetime.combine(end_date, datetime.max.time())
+        if end_datetime < start_datetime:
+            MessageBox("错误", "结束日期早于开始日期", self).exec()
+            return
+
         try:
             self.fetch_btn.setEnabled(False)
 
@@ -446,14 +536,9 @@ class MainWindow(QMainWindow):
             self.fetch_progress_dialog.start()
             self.fetch_progress_dialog.update_progress(0, "准备拉取...")
 
-            # 获取日期范围
-            start_date, end_date = self.date_range_picker.get_date_range_python()
-            start_datetime = datetime.combine(start_date, datetime.min.time())
-            end_datetime = datetime.combine(end_date, datetime.max.time())
-
             # 在后台线程拉取
             self.fetch_thread = FetchCommitsThread(
-                self.config_manager,
+                enabled_repos,
                 start_datetime,
                 end_datetime
             )
@@ -463,8 +548,8 @@ class MainWindow(QMainWindow):
             self.fetch_thread.start()
 
         except Exception as e:
-            if hasattr(self, 'fetch_progress_dialog') and self.fetch_progress_dialog:
-                self.fetch_progress_dialog.close()
+            if self.fetch_progress_dialog is not None:
+                self.fetch_progress_dialog.dismiss()
 
             logger.error(f"拉取提交记录失败: {e}", exc_info=True)
             MessageBox("错误", f"拉取提交记录失败: {str(e)}", self).exec()
@@ -473,7 +558,7 @@ class MainWindow(QMainWindow):
 
     def on_fetch_progress_updated(self, progress: int, step_text: str):
         """更新拉取进度"""
-        if hasattr(self, 'fetch_progress_dialog') and self.fetch_progress_dialog:
+        if self.fetch_progress_dialog is not None:
             self.fetch_progress_dialog.update_progress(progress, step_text)
 
     def on_fetch_finished(self, all_commits: list, failed_repos: list):
@@ -484,7 +569,7 @@ class MainWindow(QMainWindow):
         self.update_commits_display()
 
         # 更新进度对话框为成功状态
-        if hasattr(self, 'fetch_progress_dialog') and self.fetch_progress_dialog:
+        if self.fetch_progress_dialog is not None:
             success_msg = f"成功拉取 {len(all_commits)} 条提交记录!"
             self.fetch_progress_dialog.update_progress(100, success_msg)
             self.fetch_progress_dialog.set_success(success_msg)
@@ -502,7 +587,7 @@ class MainWindow(QMainWindow):
         logger.error(f"拉取提交记录失败: {error_msg}")
 
         # 更新进度对话框为错误状态
-        if hasattr(self, 'fetch_progress_dialog') and self.fetch_progress_dialog:
+        if self.fetch_progress_dialog is not None:
             self.fetch_progress_dialog.set_error(error_msg)
 
         self.status_bar.showMessage("拉取失败", 3000)
@@ -513,40 +598,52 @@ class MainWindow(QMainWindow):
         """更新提交记录显示"""
         commit_count = len(self.commits)
 
+        # 启用/禁用生成报告按钮(与标签状态无关,每次都同步)
+        self.generate_btn.setEnabled(commit_count > 0)
+
+        # 状态未变化时无需重新设置属性和刷新样式
+        if commit_count == self._commits_display_state:
+            return
+        self._commits_display_state = commit_count
+
         # 更新提交记录标签
         if commit_count > 0:
             text = f"📋 提交记录: {commit_count} 条"
             self.commits_label.setToolTip(f"共 {commit_count} 条提交记录\n点击查看详情")
             self.commits_label.setProperty("enabled", "true")
-            self.commits_label.setCursor(QCursor(Qt.PointingHandCursor))
+            self.commits_label.setCursor(get_cursor(Qt.PointingHandCursor))
         else:
             text = "📋 提交记录: 暂无数据"
             self.commits_label.setToolTip("暂无提交记录")
             self.commits_label.setProperty("enabled", "false")
-            self.commits_label.setCursor(QCursor(Qt.ArrowCursor))
+            self.commits_label.setCursor(get_cursor(Qt.ArrowCursor))
 
         self.commits_label.setText(text)
         # 强制刷新样式
         self.commits_label.style().unpolish(self.commits_label)
         self.commits_label.style().polish(self.commits_label)
 
-        # 启用/禁用生成报告按钮
-        self.generate_btn.setEnabled(commit_count > 0)
-
     def update_report_view_display(self):
         """更新报告查看标签显示"""
-        if self.last_generated_report:
+        has_report = bool(self.last_generated_report)
+
+        # 状态未变化时无需重新设置属性和刷新样式
+        if has_report == self._report_display_state:
+            return
+        self._report_display_state = has_report
+
+        if has_report:
             # 有报告可查看
             self.report_view_label.setText("📄 最近报告: 已生成 | 点击查看")
             self.report_view_label.setToolTip("点击查看最近生成的报告")
             self.report_view_label.setProperty("enabled", "true")
-            self.report_view_label.setCursor(QCursor(Qt.PointingHandCursor))
+            self.report_view_label.setCursor(get_cursor(Qt.PointingHandCursor))
         else:
             # 没有报告
             self.report_view_label.setText("📄 最近报告: 暂无")
             self.report_view_label.setToolTip("暂无已生成的报告")
             self.report_view_label.setProperty("enabled", "false")
-            self.report_view_label.setCursor(QCursor(Qt.ArrowCursor))
+            self.report_view_label.setCursor(get_cursor(Qt.ArrowCursor))
 
         # 强制刷新样式
         self.report_view_label.style().unpolish(self.report_view_label)
@@ -563,8 +660,17 @@ class MainWindow(QMainWindow):
             MessageBox("提示", "暂无已生成的报告", self).exec()
             return
 
+        if self._render_task is not None:
+            # 报告仍在后台渲染,完成后再打开(只打开一个对话框)
+            self._show_report_when_rendered = True
+            self.status_bar.showMessage("报告渲染中,完成后自动打开...", 3000)
+            return
+
         # 显示报告对话框
-        dialog = ReportDialog(self.last_generated_report, self)
+        dialog = ReportDialog(
+            self.last_generated_report, self,
+            report_html=self.last_generated_report_html
+        )
         dialog.exec()
 
     def view_commit_log(self):
@@ -576,6 +682,8 @@ class MainWindow(QMainWindow):
         try:
             logger.info(f"打开提交日志对话框, 共{len(self.commits)}条记录")
 
+            from ui.dialogs.commit_log_dialog import CommitLogDialog
+
             # 直接传递 commits 列表到对话框
             dialog = CommitLogDialog(self.commits, self)
             dialog.exec_()
@@ -590,7 +698,6 @@ class MainWindow(QMainWindow):
             MessageBox("警告", "没有提交记录", self).exec()
             return
 
-        # 检查 AI 配置
         try:
             self.generate_btn.setEnabled(False)
 
@@ -599,59 +706,79 @@ class MainWindow(QMainWindow):
             self.progress_dialog.start()
             self.progress_dialog.update_progress(0, "准备生成报告...")
 
-            # 格式化提交记录
-            self.progress_dialog.update_progress(10, "正在格式化提交记录...")
-            formatter = DataFormatter()
-            commit_summary = formatter.format_commits(self.commits)
-            logger.info(f"格式化完成, 提交记录长度: {len(commit_summary)}字符")
-
-            # 创建 AI 客户端
-            self.progress_dialog.update_progress(20, "正在创建AI客户端...")
-            ai_client = AiClientFactory.create(self.config_manager)
-
-            # 在后台线程生成报告
-            self.progress_dialog.update_progress(30, "准备调用AI...")
-            self.report_thread = GenerateReportThread(ai_client, commit_summary)
+            # 在后台线程格式化提交记录、检查 AI 配置并生成报告
+            self.report_thread = GenerateReportThread(self.config_manager, self.commits)
             self.report_thread.finished.connect(self.on_report_generated)
             self.report_thread.error.connect(self.on_report_error)
+            self.report_thread.config_error.connect(self.on_report_config_error)
             self.report_thread.progress_updated.connect(self.on_progress_updated)
+            self.report_thread.tick_requested.connect(self._start_report_progress_tick)
+            self.report_thread.tick_stop.connect(self._report_tick_timer.stop)
             self.report_thread.start()
 
-        except ValueError as e:
-            # 配置错误(例如未配置 API Key)
-            if hasattr(self, 'progress_dialog') and self.progress_dialog:
-                self.progress_dialog.close()
-
-            w = MessageBox("配置错误", f"{str(e)}\n\n是否现在配置?", self)
-            if w.exec():
-                self.open_ai_config()
-            self.status_bar.showMessage("未配置", 3000)
-            self.generate_btn.setEnabled(True)
         except Exception as e:
-            if hasattr(self, 'progress_dialog') and self.progress_dialog:
-                self.progress_dialog.close()
+            if self.progress_dialog is not None:
+                self.progress_dialog.dismiss()
 
             logger.error(f"生成报告失败: {e}", exc_info=True)
             MessageBox("错误", f"生成报告失败: {str(e)}", self).exec()
             self.status_bar.showMessage("生成失败", 3000)
             self.generate_btn.setEnabled(True)
 
+    def on_report_config_error(self, error_msg: str):
+        """
+        AI 配置错误(例如未配置 API Key)
+
+        Args:
+            error_msg: 错误信息
+        """
+        if self.progress_dialog is not None:
+            self.progress_dialog.dismiss()
+
+        w = MessageBox("配置错误", f"{error_msg}\n\n是否现在配置?", self)
+        if w.exec():
+            self.open_ai_config()
+        self.status_bar.showMessage("未配置", 3000)
+        self.generate_btn.setEnabled(True)
+
     def on_progress_updated(self, progress: int, step_text: str):
         """更新进度"""
-        if hasattr(self, 'progress_dialog') and self.progress_dialog:
+        if self.progress_dialog is not None:
             self.progress_dialog.update_progress(progress, step_text)
 
+    @Slot(int, int)
+    def _start_report_progress_tick(self, start: int, maximum: int):
+        """
+        开始模拟进度增长
+
+        Args:
+            start: 起始进度
+            maximum: 模拟的最大进度
+        """
+        self._report_progress = start
+        self._report_progress_max = maximum
+        self._report_tick_timer.start()
+
+    def _on_report_progress_tick(self):
+        """定时器回调:模拟进度增长"""
+        if self._report_progress >= self._report_progress_max:
+            self._report_tick_timer.stop()
+            return
+        self._report_progress += 1
+        self.on_progress_updated(self._report_progress, "等待AI响应中...")
+
     def on_report_generated(self, report: str):
         """报告生成完成"""
         # 保存报告到实例变量
         self.last_generated_report = report
+        self.last_generated_report_html = None
 
         # 更新报告查看标签显示
         self.update_report_view_display()
 
         # 获取 Token 用量统计（仅用于日志和状态栏）
-        if hasattr(self.report_thread, 'ai_client'):
-            usage = self.report_thread.ai_client.get_token_usage()
+        if self.report_thread is not None:
+            usage = self.report_thread.token_usage
             if usage and 'total_tokens' in usage:
                 total = usage.get('total_tokens', 0)
                 prompt = usage.get('prompt_tokens', 0)
@@ -667,24 +794,53 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("报告生成成功", 3000)
 
         # 更新进度对话框为成功状态
-        if hasattr(self, 'progress_dialog') and self.progress_dialog:
+        if self.progress_dialog is not None:
             self.progress_dialog.update_progress(100, "报告生成成功!")
             self.progress_dialog.set_success("报告生成成功!")
 
         self.generate_btn.setEnabled(True)
 
-        # 显示报告对话框
-        dialog = ReportDialog(report, self)
-        dialog.exec()
+        # 在线程池中转换为 HTML,完成后缓存并显示报告对话框
+        self._show_report_when_rendered = True
+        self._render_task = _RenderTask(report)
+        self._render_task.signals.finished.connect(self._on_report_rendered)
+        QThreadPool.globalInstance().start(self._render_task)
+
+    @Slot(str, str)
+    def _on_report_rendered(self, report: str, html_content: str):
+        """
+        报告 HTML 转换完成
+
+        Args:
+            report: 报告原文
+            html_content: 转换后的 HTML
+        """
+        if report != self.last_generated_report:
+            # 期间已生成了新的报告,以新报告的渲染任务为准
+            return
+
+        self._render_task = None
+        self.last_generated_report_html = html_content or None
+
+        # 显示报告对话框(生成完成或渲染期间点击查看时)
+        if self._show_report_when_rendered:
+            self._show_report_when_rendered = False
+            dialog = ReportDialog(report, self, report_html=self.last_generated_report_html)
+            dialog.exec()
 
     def on_report_error(self, error_msg: str):
         """报告生成失败"""
         logger.error(f"报告生成失败: {error_msg}")
 
         # 更新进度对话框为错误状态
-        if hasattr(self, 'progress_dialog') and self.progress_dialog:
+        if self.progress_dialog is not None:
             self.progress_dialog.set_error(error_msg)
 
         self.status_bar.showMessage("生成失败", 3000)
         self.generate_btn.setEnabled(True)
         MessageBox("错误", f"生成报告失败: {error_msg}", self).exec()
+
+    def closeEvent(self, event):
+        """关闭窗口前写入尚未保存的仓库配置"""
+        self.repo_list_widget.flush_save()
+        super().closeEvent(event)
@@ -3,6 +3,7 @@
 负责加载和应用 QFluentWidgets 主题
 """
 import os
+from functools import lru_cache
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QCursor
@@ -11,6 +12,43 @@ from infrastructure.logger import get_logger
 
 logger = get_logger()
 
+# 应用级样式表(只解析一次),控件通过 objectName 选择样式
+GLOBAL_QSS = """
+QLabel#clickableInfoLabel {
+    padding: 8px 12px;
+    background-color: #f5f5f5;
+    border: 1px solid #ddd;
+    border-radius: 4px;
+    font-size: 13px;
+    color: #333;
+}
+QLabel#clickableInfoLabel:hover {
+    background-color: #e8e8e8;
+    border-color: #999;
+}
+QLabel#clickableInfoLabel[enabled="false"] {
+    color: #999;
+}
+QLabel#clickableInfoLabel[enabled="false"]:hover {
+    background-color: #f5f5f5;
+    border-color: #ddd;
+}
+"""
+
+
+@lru_cache(maxsize=None)
+def get_cursor(shape: Qt.CursorShape) -> QCursor:
+    """
+    获取共享的光标实例(首次使用时创建,此时 QApplication 已存在)
+
+    Args:
+        shape: 光标形状
+
+    Returns:
+        QCursor实例
+    """
+    return QCursor(shape)
+
 
 class ThemeManager:
     """主题管理器"""
@@ -30,6 +68,9 @@ class ThemeManager:
             # 设置主题色（紫色系，与原来的UI风格一致）
             setThemeColor('#898AC4')
 
+            # 应用全局样式表
+            app.setStyleSheet(GLOBAL_QSS)
+
             logger.info("已加载 Fluent Design 主题")
             return True
 
@@ -59,7 +100,7 @@ class ThemeManager:
             label: QLabel实例
         """
         label.setObjectName("modelLabel")
-        label.setCursor(QCursor(Qt.PointingHandCursor))
+        label.setCursor(get_cursor(Qt.PointingHandCursor))
         label.style().unpolish(label)
         label.style().polish(label)
 
@@ -75,6 +116,18 @@ class ThemeManager:
         label.style().unpolish(label)
         label.style().polish(label)
 
+    @staticmethod
+    def apply_clickable_info_label_style(label):
+        """
+        为可点击的信息标签应用样式
+
+        Args:
+            label: QLabel实例
+        """
+        label.setObjectName("clickableInfoLabel")
+        label.style().unpolish(label)
+        label.style().polish(label)
+
     @staticmethod
     def apply_secondary_button_style(button):
         """
@@ -2,12 +2,53 @@
 现代日期范围选择器组件
 使用单日历 + 双击选择模式，提供流畅的用户体验
 """
+from functools import lru_cache
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QCalendarWidget, QPushButton, QFrame, QButtonGroup, QRadioButton
 )
-from PySide6.QtCore import Qt, QDate, Signal, QPoint
-from PySide6.QtGui import QTextCharFormat, QColor, QCursor
+from PySide6.QtCore import Qt, QDate, Signal, QPoint, QTimer
+from PySide6.QtGui import QTextCharFormat, QColor
+from ui.themes.theme_manager import get_cursor
+
+# 日历高亮颜色(只解析一次)
+_COLOR_TODAY_BG = QColor("#fff3e0")
+_COLOR_TODAY_FG = QColor("#ff9800")
+_COLOR_RANGE_BG = QColor("#e6f7ff")
+_COLOR_SELECTED_BG = QColor("#1890ff")
+_COLOR_SELECTED_FG = QColor("#ffffff")
+
+
+# 快捷选择面板样式(设置在面板上,所有单选按钮共用,只解析一次)
+_QUICK_PANEL_QSS = """
+QFrame {
+    background-color: #fafafa;
+    border-radius: 6px;
+    padding: 8px;
+}
+QRadioButton {
+    padding: 4px 8px;
+    font-size: 13px;
+}
+QRadioButton#quickPreset:hover {
+    background-color: #e6f7ff;
+    border-radius: 4px;
+}
+"""
+
+
+@lru_cache(maxsize=256)
+def _fmt_ymd(jd: int) -> str:
+    """
+    格式化日期为 yyyy-MM-dd(按 Julian 日缓存)
+
+    Args:
+        jd: 日期的 Julian 日
+
+    Returns:
+        格式化后的日期字符串
+    """
+    return QDate.fromJulianDay(jd).toString('yyyy-MM-dd')
 
 
 class ModernDateRangePanel(QWidget):
@@ -35,6 +76,23 @@ class ModernDateRangePanel(QWidget):
         self.temp_end_date = end_date
         self.selection_mode = "START"  # "START" or "END"
 
+        # 高亮使用的日期格式(只创建一次,每次更新时复用)
+        # 今天的格式（橙色边框）
+        self._fmt_today = QTextCharFormat()
+        self._fmt_today.setBackground(_COLOR_TODAY_BG)
+        self._fmt_today.setForeground(_COLOR_TODAY_FG)
+        # 范围内日期的格式（浅蓝色背景）
+        self._fmt_range = QTextCharFormat()
+        self._fmt_range.setBackground(_COLOR_RANGE_BG)
+        # 选中日期的格式（蓝色背景）
+        self._fmt_selected = QTextCharFormat()
+        self._fmt_selected.setBackground(_COLOR_SELECTED_BG)
+        self._fmt_selected.setForeground(_COLOR_SELECTED_FG)
+        # 当前已应用的高亮: Julian 日 -> 格式
+        self._highlight = {}
+        # 上次高亮时的 (开始, 结束, 今天) Julian 日
+        self._last_hl = None
+
         # 日历控件
         self.calendar = QCalendarWidget()
         self.calendar.setGridVisible(True)
@@ -43,13 +101,18 @@ class ModernDateRangePanel(QWidget):
         # 快捷选择按钮组
         self.quick_buttons = QButtonGroup(self)
         self.custom_radio = None  # 自定义选项的单选按钮
+        self._presets = {}  # 快捷选项单选按钮 -> 天数 / "this_month" / "last_month"
 
         self.init_ui()
 
         # 连接信号
         self.calendar.clicked.connect(self.on_date_clicked)
 
-        # 初始化显示
+        # 初始化显示延迟到下一次事件循环,让弹出面板先完成首次绘制
+        QTimer.singleShot(0, self._initial_paint)
+
+    def _initial_paint(self):
+        """首次显示范围高亮和范围标签"""
         self.update_range_highlight()
         self.update_range_label()
 
@@ -72,13 +135,7 @@ class ModernDateRangePanel(QWidget):
     def _create_quick_panel(self):
         """创建快捷选择面板"""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: #fafafa;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
+        panel.setStyleSheet(_QUICK_PANEL_QSS)
 
         layout = QVBoxLayout()
         layout.setContentsMargins(8, 8, 8, 8)
@@ -101,34 +158,16 @@ class ModernDateRangePanel(QWidget):
 
         for text, value in quick_options:
             radio = QRadioButton(text)
-            radio.setStyleSheet("""
-                QRadioButton {
-                    padding: 4px 8px;
-                    font-size: 13px;
-                }
-                QRadioButton:hover {
-                    background-color: #e6f7ff;
-                    border-radius: 4px;
-                }
-            """)
-            if isinstance(value, int):
-                radio.clicked.connect(lambda checked, days=value: self.set_quick_range(days))
-            elif value == "this_month":
-                radio.clicked.connect(lambda checked: self.set_this_month())
-            elif value == "last_month":
-                radio.clicked.connect(lambda checked: self.set_last_month())
-
+            radio.setObjectName("quickPreset")
+            self._presets[radio] = value
             self.quick_buttons.addButton(radio)
             layout.addWidget(radio)
 
+        # 所有快捷选项共用一个槽函数
+        self.quick_buttons.buttonClicked.connect(self._on_preset)
+
         # 自定义选项
         self.custom_radio = QRadioButton("自定义")
-        self.custom_radio.setStyleSheet("""
-            QRadioButton {
-                padding: 4px 8px;
-                font-size: 13px;
-            }
-        """)
         self.custom_radio.setChecked(True)  # 默认选中自定义
         self.quick_buttons.addButton(self.custom_radio)
         layout.addWidget(self.custom_radio)
@@ -172,6 +211,24 @@ class ModernDateRangePanel(QWidget):
         panel.setLayout(layout)
         return panel
 
+    def _on_preset(self, button):
+        """
+        快捷选项被点击
+
+        Args:
+            button: 被点击的单选按钮
+        """
+        value = self._presets.get(button)
+        if value is None:
+            # 自定义选项
+            return
+        if value == "this_month":
+            self.set_this_month()
+        elif value == "last_month":
+            self.set_last_month()
+        else:
+            self.set_quick_range(value)
+
     def on_date_clicked(self, date: QDate):
         """日期被点击"""
         # 切换到自定义模式
@@ -201,45 +258,54 @@ class ModernDateRangePanel(QWidget):
         self.date_range_changed.emit(self.temp_start_date, self.temp_end_date)
 
     def update_range_highlight(self):
-        """更新日期范围的高亮显示"""
+        """更新日期范围的高亮显示(只重设格式有变化的日期)"""
         start = self.temp_start_date
         end = self.temp_end_date
         today = QDate.currentDate()
 
-        # 清除所有格式
-        self.calendar.setDateTextFormat(QDate(), QTextCharFormat())
-
-        # 今天的格式（橙色边框）
-        today_format = QTextCharFormat()
-        today_format.setBackground(QColor("#fff3e0"))
-        today_format.setForeground(QColor("#ff9800"))
-
-        # 范围内日期的格式（浅蓝色背景）
-        range_format = QTextCharFormat()
-        range_format.setBackground(QColor("#e6f7ff"))
-
-        # 选中日期的格式（蓝色背景）
-        selected_format = QTextCharFormat()
-        selected_format.setBackground(QColor("#1890ff"))
-        selected_format.setForeground(QColor("#ffffff"))
-
-        # 高亮范围内的日期
-        current = start
-        while current <= end:
-            if current == start or current == end:
-                # 开始和结束日期使用选中样式
-                self.calendar.setDateTextFormat(current, selected_format)
-            elif current == today:
-                # 今天使用特殊样式
-                self.calendar.setDateTextFormat(current, today_format)
-            else:
-                # 范围内其他日期
-                self.calendar.setDateTextFormat(current, range_format)
-            current = current.addDays(1)
-
-        # 今天不在范围内时，也标记出来
-        if today < start or today > end:
-            self.calendar.setDateTextFormat(today, today_format)
+        today_format = self._fmt_today
+        range_format = self._fmt_range
+        selected_format = self._fmt_selected
+
+        # 按 Julian 日(整数)遍历,只在需要设置格式时才构造 QDate
+        start_jd = start.toJulianDay()
+        end_jd = end.toJulianDay()
+        today_jd = today.toJulianDay()
+
+        # 范围和今天都没有变化时无需处理
+        key = (start_jd, end_jd, today_jd)
+        if key == self._last_hl:
+            return
+        self._last_hl = key
+
+        # 计算本次需要高亮的日期: Julian 日 -> 格式
+        # 范围内日期先统一使用范围样式
+        highlight = dict.fromkeys(range(start_jd, end_jd + 1), range_format)
+        # 开始和结束日期使用选中样式
+        highlight[start_jd] = selected_format
+        highlight[end_jd] = selected_format
+        # 今天(无论是否在范围内)使用特殊样式,已是开始或结束日期时保持选中样式
+        if today_jd != start_jd and today_jd != end_jd:
+            highlight[today_jd] = today_format
+
+        # 与上次的高亮比较,只更新有变化的日期(期间暂停重绘,结束后统一刷新)
+        previous = self._highlight
+        default_format = QTextCharFormat()
+        calendar = self.calendar
+        calendar.setUpdatesEnabled(False)
+        try:
+            from_jd = QDate.fromJulianDay
+            for jd in previous:
+                if jd not in highlight:
+                    calendar.setDateTextFormat(from_jd(jd), default_format)
+            for jd, fmt in highlight.items():
+                if previous.get(jd) is not fmt:
+                    calendar.setDateTextFormat(from_jd(jd), fmt)
+        finally:
+            calendar.setUpdatesEnabled(True)
+            calendar.updateCells()
+
+        self._highlight = highlight
 
     def update_range_label(self):
         """更新日期范围显示标签"""
@@ -247,15 +313,18 @@ class ModernDateRangePanel(QWidget):
 
         mode_text = "开始日期" if self.selection_mode == "END" else "完成选择"
         self.range_label.setText(
-            f"📅 {self.temp_start_date.toString('yyyy-MM-dd')} 至 "
-            f"{self.temp_end_date.toString('yyyy-MM-dd')} (共 {days} 天)  |  {mode_text}"
+            f"📅 {_fmt_ymd(self.temp_start_date.toJulianDay())} 至 "
+            f"{_fmt_ymd(self.temp_end_date.toJulianDay())} (共 {days} 天)  |  {mode_text}"
         )
 
-    def set_quick_range(self, days: int):
-        """设置最近N天"""
-        end_date = QDate.currentDate()
-        start_date = end_date.addDays(-(days - 1))
+    def _apply_range(self, start_date: QDate, end_date: QDate):
+        """
+        以程序方式设置日期范围,统一刷新显示并只发出一次信号
 
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+        """
         self.temp_start_date = start_date
         self.temp_end_date = end_date
         self.selection_mode = "START"
@@ -264,19 +333,16 @@ class ModernDateRangePanel(QWidget):
         self.update_range_label()
         self.date_range_changed.emit(start_date, end_date)
 
+    def set_quick_range(self, days: int):
+        """设置最近N天"""
+        end_date = QDate.currentDate()
+        start_date = end_date.addDays(-(days - 1))
+        self._apply_range(start_date, end_date)
+
     def set_this_month(self):
         """设置为本月"""
         today = QDate.currentDate()
-        start_date = QDate(today.year(), today.month(), 1)
-        end_date = today
-
-        self.temp_start_date = start_date
-        self.temp_end_date = end_date
-        self.selection_mode = "START"
-
-        self.update_range_highlight()
-        self.update_range_label()
-        self.date_range_changed.emit(start_date, end_date)
+        self._apply_range(QDate(today.year(), today.month(), 1), today)
 
     def set_last_month(self):
         """设置为上月"""
@@ -288,14 +354,21 @@ class ModernDateRangePanel(QWidget):
             last_day_last_month.month(),
             1
         )
+        self._apply_range(first_day_last_month, last_day_last_month)
 
-        self.temp_start_date = first_day_last_month
-        self.temp_end_date = last_day_last_month
-        self.selection_mode = "START"
+    def reset_range(self, start_date: QDate, end_date: QDate):
+        """
+        重置为指定的日期范围(复用面板时调用)
 
-        self.update_range_highlight()
-        self.update_range_label()
-        self.date_range_changed.emit(first_day_last_month, last_day_last_month)
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+        """
+        self.start_date = start_date
+        self.end_date = end_date
+        if self.custom_radio:
+            self.custom_radio.setChecked(True)
+        self._apply_range(start_date, end_date)
 
     def get_date_range(self):
         """获取选择的日期范围"""
@@ -399,6 +472,18 @@ class DateRangeDropdown(QFrame):
 
         self.setLayout(layout)
 
+    def reset_range(self, start_date: QDate, end_date: QDate):
+        """
+        重置为指定的日期范围(再次显示前调用)
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+        """
+        self.start_date = start_date
+        self.end_date = end_date
+        self.date_panel.reset_range(start_date, end_date)
+
     def on_date_range_changed(self, start_date: QDate, end_date: QDate):
         """日期范围改变"""
         self.start_date = start_date
@@ -452,7 +537,7 @@ class DateRangePickerWidget(QWidget):
         self.start_date = start_date
         self.end_date = end_date
 
-        # 下拉面板
+        # 下拉面板(首次显示时创建,之后复用)
         self.dropdown = None
 
         self.init_ui()
@@ -479,7 +564,7 @@ class DateRangePickerWidget(QWidget):
                 border-color: #999;
             }
         """)
-        self.date_label.setCursor(QCursor(Qt.PointingHandCursor))
+        self.date_label.setCursor(get_cursor(Qt.PointingHandCursor))
         self.date_label.mousePressEvent = lambda event: self.show_dropdown()
         self.update_date_label()
         layout.addWidget(self.date_label)
@@ -490,22 +575,24 @@ class DateRangePickerWidget(QWidget):
         """更新日期标签显示"""
         days = self.start_date.daysTo(self.end_date) + 1
         self.date_label.setText(
-            f"📅 {self.start_date.toString('yyyy-MM-dd')} 至 "
-            f"{self.end_date.toString('yyyy-MM-dd')} (共 {days} 天) ▼"
+            f"📅 {_fmt_ymd(self.start_date.toJulianDay())} 至 "
+            f"{_fmt_ymd(self.end_date.toJulianDay())} (共 {days} 天) ▼"
         )
 
     def show_dropdown(self):
         """显示下拉面板"""
-        # 创建新的下拉面板
-        self.dropdown = DateRangeDropdown(
-            self.start_date,
-            self.end_date,
-            self
-        )
-
-        # 连接信号
-        self.dropdown.accepted.connect(self.on_dropdown_accepted)
-        self.dropdown.rejected.connect(self.on_dropdown_rejected)
+        if self.dropdown is None:
+            # 首次显示时创建下拉面板,信号只连接一次
+            self.dropdown = DateRangeDropdown(
+                self.start_date,
+                self.end_date,
+                self
+            )
+            self.dropdown.accepted.connect(self.on_dropdown_accepted)
+            self.dropdown.rejected.connect(self.on_dropdown_rejected)
+        else:
+            # 复用已有面板,恢复为当前的日期范围
+            self.dropdown.reset_range(self.start_date, self.end_date)
 
         # 显示在控件下方
         self.dropdown.show_below(self.date_label)
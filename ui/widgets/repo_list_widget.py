@@ -3,16 +3,31 @@
 显示和管理仓库列表
 """
 import os
+from functools import lru_cache
+from typing import Dict, Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QScrollArea, QFrame, QCheckBox, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QSignalBlocker, QTimer
 from qfluentwidgets import PushButton
 from ui.dialogs.repo_config_dialog import RepoConfigDialog
 from ui.dialogs.repo_detail_dialog import RepoDetailDialog
 from ui.dialogs.repo_scan_dialog import RepoScanDialog
 
+@lru_cache(maxsize=1024)
+def _basename(path: str) -> str:
+    """获取路径的最后一级名称(按路径缓存)"""
+    return os.path.basename(path)
+
+
+# 仓库项样式,设置在 RepoListWidget 上,所有仓库项共用(只解析一次)
+_REPO_LIST_QSS = """
+RepoItemWidget { border: 1px solid #ccc; border-radius: 3px; }
+RepoItemWidget QLabel#repoName { font-weight: bold; }
+RepoItemWidget QLabel#repoOriginalName { color: gray; margin-left: 5px; }
+"""
+
 
 class RepoItemWidget(QWidget):
     """单个仓库项组件"""
@@ -44,22 +59,20 @@ class RepoItemWidget(QWidget):
 
         # 启用复选框
         self.enabled_checkbox = QCheckBox()
-        self.enabled_checkbox.setChecked(self.repo_config.get('enabled', True))
         self.enabled_checkbox.stateChanged.connect(self.on_toggle)
         layout.addWidget(self.enabled_checkbox)
 
         # 仓库名称
-        name_label = QLabel(self.repo_config.get('name', '未知仓库'))
-        name_label.setStyleSheet("font-weight: bold;")
-        layout.addWidget(name_label)
+        self.name_label = QLabel()
+        self.name_label.setObjectName("repoName")
+        layout.addWidget(self.name_label)
 
-        # 原始仓库名称（如果与配置名称不一致）
-        original_name = self._get_original_repo_name()
-        config_name = self.repo_config.get('name', '未知仓库')
-        if original_name and original_name != config_name:
-            original_label = QLabel(f"({original_name})")
-            original_label.setStyleSheet("color: gray; margin-left: 5px;")
-            layout.addWidget(original_label)
+        # 原始仓库名称（如果与配置名称不一致才显示）
+        self.original_label = QLabel()
+        self.original_label.setObjectName("repoOriginalName")
+        layout.addWidget(self.original_label)
+
+        self._apply_config()
 
         layout.addStretch()
 
@@ -84,9 +97,35 @@ class RepoItemWidget(QWidget):
 
         self.setLayout(layout)
 
-        # 设置边框
+        # 设置边框(样式由 RepoListWidget 统一提供)
         self.setFrameStyle(QFrame.Box)
-        self.setStyleSheet("RepoItemWidget { border: 1px solid #ccc; border-radius: 3px; }")
+
+    def update_config(self, repo_config: dict):
+        """
+        使用新的配置就地刷新仓库项(不重建控件)
+
+        Args:
+            repo_config: 仓库配置字典
+        """
+        self.repo_config = repo_config
+        self.repo_id = repo_config.get('id', '')
+        self._apply_config()
+
+    def _apply_config(self):
+        """将当前配置显示到控件上"""
+        # 同步复选框状态时不发出 toggled 信号
+        with QSignalBlocker(self.enabled_checkbox):
+            self.enabled_checkbox.setChecked(self.repo_config.get('enabled', True))
+
+        config_name = self.repo_config.get('name', '未知仓库')
+        self.name_label.setText(config_name)
+
+        original_name = self._get_original_repo_name()
+        if original_name and original_name != config_name:
+            self.original_label.setText(f"({original_name})")
+            self.original_label.setVisible(True)
+        else:
+            self.original_label.setVisible(False)
 
     def setFrameStyle(self, style):
         """设置框架样式(兼容性)"""
@@ -101,12 +140,13 @@ class RepoItemWidget(QWidget):
         """
         repo_path = self.repo_config.get('path', '')
         if repo_path:
-            return os.path.basename(repo_path)
+            return _basename(repo_path)
         return ''
 
     def on_toggle(self, state):
         """复选框状态改变"""
-        enabled = (state == Qt.Checked)
+        # stateChanged 传递的是 int,直接读取复选框状态
+        enabled = self.enabled_checkbox.isChecked()
         self.toggled.emit(self.repo_id, enabled)
 
 
@@ -126,6 +166,16 @@ class RepoListWidget(QWidget):
         """
         super().__init__(parent)
         self.config_manager = config_manager
+        self._items: Dict[str, RepoItemWidget] = {}  # repo_id -> 仓库项,按显示顺序
+        self._repo_by_id: Dict[str, dict] = {}  # repo_id -> 仓库配置(load_repos 时重建)
+        self._total = 0  # 仓库总数
+        self._enabled_count = 0  # 已启用仓库数(切换时增量维护)
+
+        # 延迟保存配置:短时间内的多次修改合并为一次写盘
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(300)
+        self._save_timer.timeout.connect(self.config_manager.save_config)
 
         self.init_ui()
         self.load_repos()
@@ -134,6 +184,9 @@ class RepoListWidget(QWidget):
         """初始化UI"""
         layout = QVBoxLayout()
 
+        # 仓库项样式
+        self.setStyleSheet(_REPO_LIST_QSS)
+
         # 标题和添加按钮
         header_layout = QHBoxLayout()
 
@@ -165,6 +218,13 @@ class RepoListWidget(QWidget):
         self.repo_layout.setSpacing(5)
         self.repo_container.setLayout(self.repo_layout)
 
+        # 空状态提示(位于列表首位,有仓库时隐藏),仓库项插在其后,末尾为弹性空间
+        self.empty_label = QLabel("暂无仓库,点击上方「添加仓库」按钮添加")
+        self.empty_label.setStyleSheet("color: gray; padding: 20px;")
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        self.repo_layout.addWidget(self.empty_label)
+        self.repo_layout.addStretch()
+
         scroll_area.setWidget(self.repo_container)
         layout.addWidget(scroll_area)
 
@@ -176,40 +236,75 @@ class RepoListWidget(QWidget):
         self.setLayout(layout)
 
     def load_repos(self):
-        """加载仓库列表"""
-        # 清空现有列表
-        while self.repo_layout.count():
-            item = self.repo_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
+        """加载仓库列表(与已有仓库项比对,只增删变化的项,其余就地更新)"""
         # 获取仓库列表
         repos = self.config_manager.get_repos()
+        new_ids = {repo.get('id', '') for repo in repos}
+
+        # 批量增删期间暂停容器重绘,结束后统一布局和绘制一次
+        self.repo_container.setUpdatesEnabled(False)
+        try:
+            # 移除已删除的仓库项
+            for repo_id in [rid for rid in self._items if rid not in new_ids]:
+                repo_item = self._items.pop(repo_id)
+                self.repo_layout.removeWidget(repo_item)
+                repo_item.deleteLater()
+
+            # 新增或更新仓库项,并保持与配置一致的顺序(索引 0 为空状态提示)
+            items = {}
+            for index, repo in enumerate(repos, 1):
+                repo_id = repo.get('id', '')
+                repo_item = self._items.get(repo_id)
+                if repo_item is None:
+                    repo_item = RepoItemWidget(repo)
+                    repo_item.toggled.connect(self.on_repo_toggled)
+                    repo_item.detail_clicked.connect(self.show_repo_detail)
+                    repo_item.edit_clicked.connect(self.edit_repo)
+                    repo_item.delete_clicked.connect(self.delete_repo)
+                    self.repo_layout.insertWidget(index, repo_item)
+                else:
+                    repo_item.update_config(repo)
+                    if self.repo_layout.indexOf(repo_item) != index:
+                        self.repo_layout.removeWidget(repo_item)
+                        self.repo_layout.insertWidget(index, repo_item)
+                items[repo_id] = repo_item
+            self._items = items
+        finally:
+            self.repo_container.setUpdatesEnabled(True)
+
+        # 空状态
+        self.empty_label.setVisible(not repos)
+
+        # 按 ID 索引仓库配置(与配置管理器共享同一字典,切换启用状态时无需更新)
+        self._repo_by_id = {repo.get('id', ''): repo for repo in repos}
 
-        if not repos:
-            # 显示空状态
-            empty_label = QLabel("暂无仓库,点击上方「添加仓库」按钮添加")
-            empty_label.setStyleSheet("color: gray; padding: 20px;")
-            empty_label.setAlignment(Qt.AlignCenter)
-            self.repo_layout.addWidget(empty_label)
-            self.update_stats(0, 0)
-            return
+        # 更新统计
+        self._total = len(repos)
+        self._enabled_count = sum(1 for r in repos if r.get('enabled', True))
+        self.update_stats(self._total, self._enabled_count)
 
-        # 添加仓库项
-        for repo in repos:
-            repo_item = RepoItemWidget(repo)
-            repo_item.toggled.connect(self.on_repo_toggled)
-            repo_item.detail_clicked.connect(self.show_repo_detail)
-            repo_item.edit_clicked.connect(self.edit_repo)
-            repo_item.delete_clicked.connect(self.delete_repo)
-            self.repo_layout.addWidget(repo_item)
+    def _get_repo(self, repo_id: str) -> Optional[dict]:
+        """
+        根据 ID 获取仓库配置的副本
 
-        # 添加弹性空间
-        self.repo_layout.addStretch()
+        Args:
+            repo_id: 仓库ID
 
-        # 更新统计
-        enabled_count = sum(1 for r in repos if r.get('enabled', True))
-        self.update_stats(len(repos), enabled_count)
+        Returns:
+            仓库配置字典,如果不存在返回 None
+        """
+        repo = self._repo_by_id.get(repo_id)
+        return repo.copy() if repo is not None else None
+
+    def schedule_save(self):
+        """安排保存配置(300ms 内的多次调用只写盘一次)"""
+        self._save_timer.start()
+
+    def flush_save(self):
+        """立即保存尚未写盘的配置(关闭窗口前调用)"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.config_manager.save_config()
 
     def update_stats(self, total: int, enabled: int):
         """
@@ -228,7 +323,7 @@ class RepoListWidget(QWidget):
             config = dialog.get_config()
             # 添加到配置
             self.config_manager.add_repo(**config)
-            self.config_manager.save_config()
+            self.schedule_save()
 
             # 重新加载列表
             self.load_repos()
@@ -250,7 +345,7 @@ class RepoListWidget(QWidget):
         Args:
             repo_id: 仓库ID
         """
-        repo_config = self.config_manager.get_repo_by_id(repo_id)
+        repo_config = self._get_repo(repo_id)
         if not repo_config:
             QMessageBox.warning(self, "错误", "仓库不存在")
             return
@@ -260,7 +355,7 @@ class RepoListWidget(QWidget):
             updated_config = dialog.get_config()
             # 更新配置
             self.config_manager.update_repo(repo_id, **updated_config)
-            self.config_manager.save_config()
+            self.schedule_save()
 
             # 重新加载列表
             self.load_repos()
@@ -273,7 +368,7 @@ class RepoListWidget(QWidget):
         Args:
             repo_id: 仓库ID
         """
-        repo_config = self.config_manager.get_repo_by_id(repo_id)
+        repo_config = self._get_repo(repo_id)
         if not repo_config:
             return
 
@@ -290,7 +385,7 @@ class RepoListWidget(QWidget):
 
         if reply == QMessageBox.Yes:
             self.config_manager.delete_repo(repo_id)
-            self.config_manager.save_config()
+            self.schedule_save()
 
             # 重新加载列表
             self.load_repos()
@@ -303,7 +398,7 @@ class RepoListWidget(QWidget):
         Args:
             repo_id: 仓库ID
         """
-        repo_config = self.config_manager.get_repo_by_id(repo_id)
+        repo_config = self._get_repo(repo_id)
         if not repo_config:
             QMessageBox.warning(self, "错误", "仓库不存在")
             return
@@ -319,12 +414,15 @@ class RepoListWidget(QWidget):
             repo_id: 仓库ID
             enabled: 是否启用
         """
-        self.config_manager.toggle_repo(repo_id)
-        self.config_manager.save_config()
-
-        # 更新统计(不重新加载整个列表)
-        repos = self.config_manager.get_repos()
-        enabled_count = sum(1 for r in repos if r.get('enabled', True))
-        self.update_stats(len(repos), enabled_count)
+        if not self.config_manager.toggle_repo(repo_id):
+            return
+        self.schedule_save()
+
+        # 增量更新统计(不重新加载整个列表),以切换后的配置状态为准
+        repo = self._repo_by_id.get(repo_id)
+        if repo is not None:
+            enabled = repo.get('enabled', True)
+        self._enabled_count += 1 if enabled else -1
+        self.update_stats(self._total, self._enabled_count)
 
         self.repos_changed.emit()
@@ -4,8 +4,29 @@
 """
 import os
 import sys
+from functools import lru_cache
 
+# 资源根目录和数据根目录只在导入时计算一次
+# PyInstaller 创建临时文件夹，将路径存储在 _MEIPASS 中；开发环境使用项目根目录
+_BASE_RESOURCE = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+# 打包环境使用可执行文件所在目录，开发环境使用项目根目录
+_BASE_DATA = os.path.join(
+    os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else os.path.abspath("."),
+    "data"
+)
 
+# 已确认存在的数据目录,避免每次调用都访问文件系统
+_ensured_dirs = set()
+
+
+def _ensure_dir(path):
+    """确保目录存在(每个目录只检查一次)"""
+    if path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+@lru_cache(maxsize=None)
 def get_resource_path(relative_path):
     """
     获取资源文件的绝对路径（静态资源：图标、样式等）
@@ -23,17 +44,10 @@ def get_resource_path(relative_path):
         >>> icon_path = get_resource_path('app_icon.ico')
         >>> styles_path = get_resource_path('ui/themes/styles.qss')
     """
-    try:
-        # PyInstaller 创建临时文件夹，将路径存储在 _MEIPASS 中
-        base_path = sys._MEIPASS
-    except AttributeError:
-        # 开发环境：使用项目根目录
-        base_path = os.path.abspath(".")
-
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_RESOURCE, relative_path)
 
 
-def get_data_path(relative_path=""):
+def get_data_path(relative_path="", *, is_dir=False):
     """
     获取数据目录路径（动态数据：配置、日志、报告等）
 
@@ -48,35 +62,27 @@ def get_data_path(relative_path=""):
 
     Args:
         relative_path: 相对于数据目录的路径（可选）
+        is_dir: relative_path 是否为目录，为 True 时确保该目录存在
 
     Returns:
         数据文件的绝对路径
 
     Example:
         >>> config_path = get_data_path("config.json")
-        >>> log_dir = get_data_path("logs")
+        >>> log_dir = get_data_path("logs", is_dir=True)
         >>> data_dir = get_data_path()  # 只获取 data 目录本身
     """
-    if getattr(sys, 'frozen', False):
-        # 打包环境：使用可执行文件所在目录
-        base_path = os.path.dirname(sys.executable)
-    else:
-        # 开发环境：使用项目根目录
-        base_path = os.path.abspath(".")
-
-    data_dir = os.path.join(base_path, "data")
+    data_dir = _BASE_DATA
 
     # 确保 data 目录存在
-    if not os.path.exists(data_dir):
-        os.makedirs(data_dir)
+    _ensure_dir(data_dir)
 
     # 如果指定了相对路径，返回完整路径
     if relative_path:
         full_path = os.path.join(data_dir, relative_path)
-        # 如果是目录路径，确保目录存在
-        if not os.path.splitext(relative_path)[1]:  # 没有文件扩展名，判断为目录
-            if not os.path.exists(full_path):
-                os.makedirs(full_path)
+        # 调用方指明是目录时，确保目录存在
+        if is_dir:
+            _ensure_dir(full_path)
         return full_path
 
     return data_dir